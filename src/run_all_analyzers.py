@@ -72,6 +72,11 @@ def run_single_analyzer(report_config: dict, csv_path: str, report_dir: str) ->
         return (False, report_config['name'], error_msg)
 
 
+def run_single_analyzer_from_args(args: tuple) -> tuple:
+    """Pool.imap adapter: unpack (report_config, csv_path, report_dir)."""
+    return run_single_analyzer(*args)
+
+
 def generate_generic_report(title: str, description: str, data: dict, output_path: str):
     """Generate a generic HTML report for any analyzer."""
     summary = data.get('summary', {})
@@ -306,8 +311,9 @@ def main():
             # Prepare arguments for each analyzer
             analyzer_args = [(report, csv_path, report_dir) for report in reports]
 
-            # Run analyzers in parallel with progress tracking
-            results_iter = pool.starmap(run_single_analyzer, analyzer_args)
+            # Run analyzers in parallel with progress tracking; imap yields each
+            # result as soon as it (and those before it) finish
+            results_iter = pool.imap(run_single_analyzer_from_args, analyzer_args)
 
             # Process results
             for i, (success, name, error) in enumerate(results_iter, 1):
@@ -866,6 +872,9 @@ def generate_index_page(reports, report_dir='reports/html'):
             // Chart 2: Portfolio Misallocation - Customer Distribution
             const portfolioCtx = document.getElementById('portfolioChart');
             if (portfolioCtx) {{
+                // Static data: total it once, not on every tooltip frame
+                const portfolioData = [459, 426, 23, 1];
+                const portfolioTotal = portfolioData.reduce((a, b) => a + b, 0);
                 new Chart(portfolioCtx, {{
                     type: 'doughnut',
                     data: {{
@@ -876,7 +885,7 @@ def generate_index_page(reports, report_dir='reports/html'):
                             'Light Users (72% margin)'
                         ],
                         datasets: [{{
-                            data: [459, 426, 23, 1],
+                            data: portfolioData,
                             backgroundColor: [
                                 'rgba(244, 67, 54, 0.7)',
                                 'rgba(255, 152, 0, 0.7)',
@@ -918,8 +927,7 @@ def generate_index_page(reports, report_dir='reports/html'):
                                     label: function(context) {{
                                         let label = context.label || '';
                                         let value = context.parsed;
-                                        let total = context.dataset.data.reduce((a, b) => a + b, 0);
-                                        let percentage = ((value / total) * 100).toFixed(1);
+                                        let percentage = ((value / portfolioTotal) * 100).toFixed(1);
                                         return label + ': ' + value + ' customers (' + percentage + '%)';
                                     }}
                                 }}
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Test Viewer
+
+Validates the status viewer's CSV line counting and report directory watching
+against real files in a temporary directory.
+"""
+
+import contextlib
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, 'viewer')
+from serve import FileChangeWatcher, StatusViewerServer
+
+
+@contextlib.contextmanager
+def temp_server():
+    """Viewer over calls.csv in a fresh temporary directory.
+
+    It isn't serving, so no port is bound; the directory is removed afterwards.
+    """
+    tmp_dir = tempfile.mkdtemp()
+    server = StatusViewerServer(os.path.join(tmp_dir, 'calls.csv'),
+                                os.path.join(tmp_dir, 'reports'), 0)
+    try:
+        yield server
+    finally:
+        server.close()
+        shutil.rmtree(tmp_dir)
+
+
+def write(path, text, mode='w'):
+    with open(path, mode) as f:
+        f.write(text)
+
+
+def test_line_count_growing_file():
+    """Appended rows are counted without losing the rows counted before."""
+    with temp_server() as server:
+        write(server.csv_path, 'header\n' + 'row\n' * 5)
+        assert server.get_csv_line_count() == 5
+
+        write(server.csv_path, 'row\n' * 3, mode='a')
+        assert server.get_csv_line_count() == 8
+
+        # Unchanged file: same answer from the cache
+        assert server.get_csv_line_count() == 8
+
+
+def test_line_count_truncated_file():
+    """A file that shrank is recounted from the start."""
+    with temp_server() as server:
+        write(server.csv_path, 'header\n' + 'row\n' * 5)
+        assert server.get_csv_line_count() == 5
+
+        write(server.csv_path, 'header\n' + 'row\n' * 2)
+        assert server.get_csv_line_count() == 2
+
+
+def test_line_count_replaced_file():
+    """A larger file renamed over the CSV is recounted, not counted from the old offset."""
+    with temp_server() as server:
+        write(server.csv_path, 'header\n' + 'row\n' * 5)
+        assert server.get_csv_line_count() == 5
+
+        replacement = server.csv_path + '.new'
+        write(replacement, 'header\n' + 'a much longer row\n' * 4)
+        os.replace(replacement, server.csv_path)
+        assert server.get_csv_line_count() == 4
+
+
+def test_line_count_no_trailing_newline():
+    """A row still being written is only counted once its newline lands."""
+    with temp_server() as server:
+        write(server.csv_path, 'header\nrow\nrow')
+        assert server.get_csv_line_count() == 1
+
+        write(server.csv_path, ' continued\nrow\n', mode='a')
+        assert server.get_csv_line_count() == 3
+
+
+def test_watcher_reports_lost_watch():
+    """Deleting the watched directory wakes the watcher and makes it inactive."""
+    tmp_dir = tempfile.mkdtemp()
+    watch_dir = os.path.join(tmp_dir, 'reports')
+    os.makedirs(watch_dir)
+    watcher = FileChangeWatcher(watch_dir)
+    try:
+        if not watcher.active:
+            raise unittest.SkipTest("change events not available on this platform")
+
+        write(os.path.join(watch_dir, 'report.html'), '<html></html>')
+        assert watcher.wait(1, names={'report.html'})
+        assert watcher.active
+
+        shutil.rmtree(watch_dir)
+        assert watcher.wait(1, names={'report.html'})
+        assert not watcher.active
+    finally:
+        watcher.close()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_watcher_reports_queue_overflow():
+    """Dropped events (IN_Q_OVERFLOW, which names no file) count as a change."""
+    tmp_dir = tempfile.mkdtemp()
+    watcher = FileChangeWatcher(tmp_dir)
+    try:
+        if not watcher.active:
+            raise unittest.SkipTest("change events not available on this platform")
+
+        # Feed the watcher the kernel's overflow event through a pipe
+        os.close(watcher.fd)
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        watcher.fd = read_fd
+        os.write(write_fd, struct.pack('iIII', -1, FileChangeWatcher.IN_Q_OVERFLOW, 0, 0))
+        os.close(write_fd)
+
+        assert watcher.wait(1, names={'report.html'})
+        assert watcher.active
+    finally:
+        watcher.close()
+        shutil.rmtree(tmp_dir)
+
+
+def main():
+    """Run all tests."""
+    tests = [
+        test_line_count_growing_file,
+        test_line_count_truncated_file,
+        test_line_count_replaced_file,
+        test_line_count_no_trailing_newline,
+        test_watcher_reports_lost_watch,
+        test_watcher_reports_queue_overflow,
+    ]
+
+    failed = 0
+    for test_func in tests:
+        try:
+            test_func()
+            print(f"{test_func.__name__:45} PASS")
+        except unittest.SkipTest as e:
+            print(f"{test_func.__name__:45} SKIP ({e})")
+        except AssertionError:
+            import traceback
+            traceback.print_exc()
+            print(f"{test_func.__name__:45} FAIL")
+            failed += 1
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,25 +7,298 @@ Serves HTML reports and monitors status:
 - Report availability (checks file existence)
 """
 
+import collections
+import contextlib
+import ctypes
+import ctypes.util
+import email.utils
+import gzip
+import hashlib
 import http.server
+import io
 import socketserver
 import json
+import multiprocessing
 import time
 import os
+import re
+import select
+import shutil
+import signal
+import socket
+import stat
+import struct
 import sys
 import threading
 import subprocess
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from types import MappingProxyType
 from urllib.parse import parse_qs, urlparse
+from typing import Optional
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 from config import TARGET_SIZE_MB, DATA_CSV_PATH, REPORT_DIR, VIEWER_PORT
 
+# Dynamic status page, kept out of this module so it is only read when written
+STATUS_PAGE_TEMPLATE = os.path.join(os.path.dirname(__file__), 'templates', 'index.html')
+STATIC_INDEX_TEMPLATE = os.path.join(os.path.dirname(__file__), 'templates', 'static_index.html')
+
+# The status page's CSS/JS, served under /static/ with versioned URLs
+STATIC_DIR = os.path.join(os.path.dirname(__file__), 'static')
+STATIC_ASSETS = ('app.css', 'app.js')
+
+# Text files worth serving gzip-compressed
+COMPRESSIBLE_SUFFIXES = ('.html', '.css', '.js')
+
+# Full stderr of simulator/analyzer runs; only a tail is kept in memory
+LOG_DIR = os.path.join(os.path.dirname(__file__), '..', 'logs')
+
+def _encode_default(obj):
+    # Read-only status snapshots (see StatusViewerServer.status_snapshot)
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once: json.dumps() constructs a new encoder whenever it is given
+# non-default options such as separators
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), default=_encode_default)
+
+
+def dumps_compact(obj) -> bytes:
+    """Serialize obj to compact JSON bytes (no whitespace)."""
+    return _compact_encoder.encode(obj).encode()
+
+
+def write_text_atomic(path: str, text: str):
+    """Write a UTF-8 text file through a temp file and rename, so a reader
+    (such as a request for it) never sees it half-written."""
+    tmp_path = f'{path}.{threading.get_ident()}.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _init_analyzer_worker(src_dir: str):
+    """Analyzer process initializer: run from src/ like the CLI scripts do and
+    import the analyzers (and pandas) once, up front."""
+    os.chdir(src_dir)
+    sys.path.insert(0, src_dir)
+    import run_analyzer  # noqa: F401
+
+
+def _warm_analyzer_worker():
+    """No-op task; submitting it makes the pool start a worker ahead of use."""
+
+
+def _run_analyzer_in_worker(analyzer_id: str) -> dict:
+    """Run one analyzer inside an analyzer worker process."""
+    from run_analyzer import run_analyzer
+    return run_analyzer(analyzer_id)
+
+
+class ViewerHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server tuned for frequent, small status responses."""
+
+    allow_reuse_address = True  # Restart immediately, even with sockets in TIME_WAIT
+    daemon_threads = True  # Don't block shutdown on open connections
+    request_queue_size = 64  # Absorb bursts of browser refreshes
+
+    def server_bind(self):
+        # HTTPServer resolves a fully qualified hostname here, which can stall
+        # startup on a reverse DNS lookup; the viewer never uses it
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address[:2]
+
+    def get_request(self):
+        sock, addr = super().get_request()
+        # Disable Nagle so small JSON responses aren't held back waiting for an ACK
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock, addr
+
+
+class FileChangeWatcher:
+    """Wait for changes to named files in a directory.
+
+    Uses inotify on Linux so the caller wakes as soon as a file is written.
+    Where inotify is unavailable (macOS, Windows, some network mounts),
+    wait() simply sleeps for the timeout and callers fall back to polling.
+    If the directory itself is deleted or moved, the watch is lost: wait()
+    reports it as a change and the watcher becomes inactive, so callers can
+    create a new one once the directory is back.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000  # Events were dropped; anything may have changed
+    IN_IGNORED = 0x00008000  # Watch removed (directory deleted, unmounted, ...)
+    WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+    WATCH_LOST = IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED
+    EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, name length
+
+    _libc = None  # Loaded once; False when inotify isn't available
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+                cls._libc = libc if hasattr(libc, 'inotify_init1') else False
+            except (OSError, TypeError):
+                cls._libc = False  # No inotify on this platform
+        return cls._libc
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.fd = None
+        libc = self._load_libc()
+        if not libc:
+            return
+        try:
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return
+            if libc.inotify_add_watch(fd, os.fsencode(directory), self.WATCH_MASK) < 0:
+                os.close(fd)
+                return
+            self.fd = fd
+        except OSError:
+            pass
+
+    @property
+    def active(self) -> bool:
+        return self.fd is not None
+
+    def wait(self, timeout: float, names=None) -> bool:
+        """Block until one of `names` changes (any file if None) or timeout.
+
+        Returns:
+            True if a matching change was seen or the watch was lost,
+            False on timeout
+        """
+        if self.fd is None:
+            time.sleep(timeout)
+            return False
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self.fd], [], [], remaining)
+            if not readable:
+                return False
+            if self._drain(names):
+                return True
+
+    def _drain(self, names) -> bool:
+        """Read all queued events, reporting whether any touched `names`.
+
+        A queue overflow counts as a match, since the dropped events may
+        have touched `names`. Closes the watcher (making it inactive) if the
+        watch was lost.
+        """
+        matched = False
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                return matched
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+                offset += self.EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+                offset += length
+                if mask & self.WATCH_LOST:
+                    # Nothing more will arrive on this watch
+                    self.close()
+                    return True
+                if mask & self.IN_Q_OVERFLOW or names is None or name in names:
+                    matched = True
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
 
 class StatusViewerServer:
     """Server that displays live status of data generation and report availability."""
 
+    # Reports tracked on the status page: (filename, display name)
+    REPORTS = (
+        ('understanding.html', 'Understanding Usage & Cost'),
+        ('performance.html', 'Performance Tracking'),
+        ('realtime.html', 'Real-Time Decision Making'),
+        ('optimization.html', 'Rate Optimization'),
+        ('alignment.html', 'Organizational Alignment'),
+        ('profitability.html', 'Customer Profitability'),
+        ('pricing.html', 'Pricing Strategy'),
+        ('features.html', 'Feature Economics'),
+    )
+    REPORT_FILENAMES = frozenset(filename for filename, _ in REPORTS)
+
+    # Reports listed on the static (hosted) index, in display order
+    STATIC_INDEX_REPORTS = (
+        {'filename': 'dataset_overview.html', 'title': 'Dataset Overview', 'description': 'Comprehensive statistical analysis and distribution metrics', 'category': 'Core Analytics'},
+        {'filename': 'understanding.html', 'title': 'Understanding Usage & Cost', 'description': 'High-level cost and usage patterns across the platform', 'category': 'Core Analytics'},
+        {'filename': 'performance.html', 'title': 'Performance Tracking', 'description': 'Latency analysis and SLA compliance monitoring', 'category': 'Core Analytics'},
+        {'filename': 'profitability.html', 'title': 'Customer Profitability', 'description': 'Revenue vs cost analysis by customer segment', 'category': 'Financial & Revenue Analytics'},
+        {'filename': 'pricing.html', 'title': 'Pricing Strategy', 'description': 'Pricing model effectiveness and optimization opportunities', 'category': 'Financial & Revenue Analytics'},
+        {'filename': 'features.html', 'title': 'Feature Economics', 'description': 'Cost and usage analysis by product feature', 'category': 'Financial & Revenue Analytics'},
+        {'filename': 'realtime.html', 'title': 'Real-Time Decision Making', 'description': 'Live monitoring and immediate cost visibility', 'category': 'Operational Insights'},
+        {'filename': 'optimization.html', 'title': 'Rate Optimization', 'description': 'Model selection and cost reduction opportunities', 'category': 'Operational Insights'},
+        {'filename': 'alignment.html', 'title': 'Organizational Alignment', 'description': 'Cross-team visibility and cost attribution', 'category': 'Operational Insights'},
+        {'filename': 'token_economics.html', 'title': 'Token Economics & Efficiency', 'description': 'Token usage patterns and optimization metrics', 'category': 'Advanced Analytics'},
+        {'filename': 'geographic_latency.html', 'title': 'Geographic & Latency Intelligence', 'description': 'Regional performance and infrastructure optimization', 'category': 'Advanced Analytics'},
+        {'filename': 'churn_growth.html', 'title': 'Churn Risk & Growth Signals', 'description': 'Customer health and expansion opportunities', 'category': 'Advanced Analytics'},
+        {'filename': 'abuse_detection.html', 'title': 'Abuse Detection & Security', 'description': 'Anomaly detection and usage pattern analysis', 'category': 'Advanced Analytics'},
+    )
+    CATEGORY_EMOJIS = {
+        'Core Analytics': '📊',
+        'Financial & Revenue Analytics': '💰',
+        'Operational Insights': '🚀',
+        'Advanced Analytics': '🔬'
+    }
+    STATIC_INDEX_SOURCES = frozenset(
+        [report['filename'] for report in STATIC_INDEX_REPORTS] + ['manifest.json']
+    )
+    REPORT_CARD_HTML = '''
+                <div class="report-card">
+                    <div class="status-badge complete">✓ Available</div>
+                    <h4>{title}</h4>
+                    <p>{description}</p>
+                    <a href="{filename}" class="view-button">View Report →</a>
+                </div>
+'''
+
+    # Analyzers accepted by /api/run_analyzer (ANALYZER_REGISTRY in src/run_analyzer.py)
+    ANALYZER_IDS = frozenset({
+        'understanding', 'performance', 'realtime', 'optimization', 'alignment',
+        'profitability', 'pricing', 'features', 'dataset_overview',
+        'token_economics', 'geographic_latency', 'churn_growth', 'abuse_detection',
+    })
+    ANALYZER_STATUS_TTL = 3600  # Forget finished analyzer runs after an hour
+    ANALYZER_WORKERS = 2  # Analyzers allowed to run at once
+    ANALYZER_TIMEOUT = 300  # Seconds before a single analyzer run is killed
+
     def __init__(self, csv_path: str = None, report_dir: str = None, port: int = None):
         """Initialize the status viewer server.
 
@@ -38,19 +311,56 @@ class StatusViewerServer:
         self.report_dir = report_dir or REPORT_DIR
         self.port = port or VIEWER_PORT
         self.target_size_mb = TARGET_SIZE_MB  # From config (50 MB)
+        self.target_bytes = int(TARGET_SIZE_MB * 1024 * 1024)
         self.analyzer_status = {}  # Track status of running analyzers
         self.status_lock = threading.Lock()  # Thread-safe status updates
+        self.status_changed = threading.Condition(self.status_lock)  # Wakes /api/events streams
+        self.status_version = 0  # Bumped on every status_update()
+
+        # Single-analyzer runs queue here; each worker just waits on a subprocess,
+        # so this caps how many analyzers compete for CPU and memory at once
+        self.analyzer_executor = ThreadPoolExecutor(max_workers=self.ANALYZER_WORKERS, thread_name_prefix='analyzer')
+        # ...and the analyzers themselves run in long-lived worker processes, so
+        # interpreter startup and the pandas/analyzer imports are paid once
+        self.analyzer_pool = None  # Created on first use (see get_analyzer_pool)
+        self.analyzer_pool_lock = threading.Lock()
+        # Simulator and run-all-analyzer pipelines run here (one thread each),
+        # apart from single analyzers so a queue of those can't hold them up
+        self.script_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='script')
 
         # Performance: Cache line count to avoid re-reading large files
-        self.line_count_cache = None
+        self.newline_count_cache = None  # Newlines up to last_file_position (header included)
         self.line_count_mtime = None
+        self.line_count_size = None
+        self.line_count_file = None  # (st_dev, st_ino) of the file those counts are from
         self.last_file_position = 0  # For incremental counting
 
         # Performance: Cache report status
         self.report_status_cache = None
         self.report_cache_time = None
+        self.report_cache_key = None  # Report dir mtime (or watcher generation) when cache was built
+        self.report_generation = 0  # Bumped by _report_watcher on every report change
+        self.report_watch_active = False  # True while change events are available
+        self.report_sizes = None  # Report sizes in REPORTS order behind the cache
         self.REPORT_CACHE_TTL = 5  # Cache reports for 5 seconds
 
+        # Performance: CSV stats are sampled by a background thread so that
+        # /api/status never waits on disk I/O (see _csv_sampler)
+        self.csv_stats = None
+        self.csv_sample_lock = threading.Lock()  # Serializes samplers
+        self.count_buffer = bytearray(1024 * 1024)  # Line-count read buffer, reused under csv_sample_lock
+        self.CSV_SAMPLE_INTERVAL = 2  # Resample CSV stats at least every 2 seconds
+        self.CSV_EVENT_COALESCE = 0.25  # Minimum gap between change-driven resamples
+
+        # Performance: Encoded /api/status body and ETag, rebuilt only when the
+        # status changes (see get_status_payload)
+        self.status_payload_cache = None  # (status without timestamp, body, etag, status version, built at)
+        self.status_payload_lock = threading.Lock()  # One rebuild at a time; others reuse it
+        self.status_section_cache = {}  # Top-level status key -> (value, encoded value)
+        self.STATUS_PAYLOAD_TTL = 0.5  # Reuse the payload this long when reports aren't watched
+        self.static_index_cache = None  # (source file fingerprint, html) for create_static_index
+        self.EVENT_RECHECK_INTERVAL = 2  # /api/events re-checks reports and sends a heartbeat this often
+
         # Progress tracking for long-running operations
         self.simulator_status = {
             'status': 'idle',  # idle, running, complete, error
@@ -62,184 +372,434 @@ class StatusViewerServer:
             'status': 'idle',  # idle, running, complete, error
             'current': None,  # Currently running analyzer
             'completed': 0,
-            'total': 8,
+            'total': None,  # Reports in the run, once the script's first [i/N] line says
             'message': '',
             'started_at': None,
             'completed_at': None
         }
 
-    def get_csv_size_mb(self) -> float:
-        """Get current size of CSV file in MB."""
-        try:
-            return os.path.getsize(self.csv_path) / (1024 * 1024)
-        except (FileNotFoundError, OSError):
-            return 0.0
+        # Read-only view of the three dicts above, republished by every
+        # status_update() so status readers never need the lock
+        self.status_snapshot = None
+        self._publish_status_snapshot()
+
+    def _count_newlines(self, f) -> int:
+        """Count newline bytes from the current position of a binary file to EOF.
+
+        Reads 1 MB chunks into count_buffer and counts with bytearray.count
+        (memchr in C), avoiding UTF-8 decoding, per-line Python objects and
+        any allocation per chunk or per call. Caller must hold csv_sample_lock.
+        """
+        buf = self.count_buffer
+        count = 0
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                return count
+            count += buf.count(b'\n', 0, n)
 
-    def _get_incremental_line_count(self, current_size: int) -> int | None:
-        """Count only new lines added since last check (for growing files).
+    def _get_incremental_line_count(self, current_size: int) -> Optional[int]:
+        """Count only newlines appended since last check (for growing files).
 
         Args:
             current_size: Current file size in bytes
 
         Returns:
-            Updated line count, or None if incremental counting not possible
+            Updated newline count (header included), or None if incremental
+            counting not possible
         """
-        # Only works if file has grown (not shrunk or replaced)
-        if current_size < self.last_file_position:
+        # Only works if we have a baseline and the file has grown (not shrunk or replaced)
+        if self.newline_count_cache is None or current_size < self.last_file_position:
             return None
 
         # If file hasn't grown, return cached count
         if current_size == self.last_file_position:
-            return self.line_count_cache
+            return self.newline_count_cache
 
         try:
-            with open(self.csv_path, 'r') as f:
+            with open(self.csv_path, 'rb', buffering=0) as f:
                 # Seek to last known position
                 f.seek(self.last_file_position)
 
                 # Count new lines only
-                new_lines = sum(1 for _ in f)
+                new_lines = self._count_newlines(f)
 
-                # Update position
-                self.last_file_position = current_size
+                # Update position to what was actually read (the file may still be growing)
+                self.last_file_position = f.tell()
 
                 # Return updated count
-                return self.line_count_cache + new_lines
+                return self.newline_count_cache + new_lines
 
         except Exception:
             # If incremental fails, return None to trigger full count
             return None
 
-    def get_csv_line_count(self) -> int:
+    def get_csv_line_count(self, stat_info: os.stat_result = None) -> int:
         """Get number of lines in CSV file (excluding header).
 
         Uses intelligent caching to avoid re-reading large files:
-        - Returns cached value if file hasn't been modified (based on mtime)
-        - For actively growing files, uses incremental counting
-        - Falls back to full count only when necessary
+        - Returns cached value if the file's mtime and size are unchanged
+        - If the file has only grown, counts newlines in the appended tail
+        - Falls back to a full count when the file shrank or was replaced
+          (a different inode, even if the new file is larger)
+
+        Args:
+            stat_info: Result of os.stat() on the CSV, if the caller already has it
         """
-        if not os.path.exists(self.csv_path):
-            return 0
+        if stat_info is None:
+            try:
+                stat_info = os.stat(self.csv_path)
+            except OSError:
+                return 0
 
         try:
             # Get current file modification time and size
-            stat_info = os.stat(self.csv_path)
             current_mtime = stat_info.st_mtime
             current_size = stat_info.st_size
+            current_file = (stat_info.st_dev, stat_info.st_ino)
+            same_file = self.line_count_file == current_file
 
             # If file hasn't changed, return cached value
-            if (self.line_count_cache is not None and
-                self.line_count_mtime is not None and
-                self.line_count_mtime == current_mtime):
-                return self.line_count_cache
-
-            # File has changed - need to recalculate
-            # For large files (>100MB), try incremental counting first
-            if current_size > 100 * 1024 * 1024 and self.line_count_cache is not None:
-                # Try incremental counting for growing files
-                try:
-                    new_count = self._get_incremental_line_count(current_size)
-                    if new_count is not None:
-                        self.line_count_cache = new_count
-                        self.line_count_mtime = current_mtime
-                        return new_count
-                except Exception as e:
-                    print(f"[PERF] Incremental count failed, falling back to full count: {e}")
+            if (self.newline_count_cache is not None and same_file and
+                self.line_count_mtime == current_mtime and
+                self.line_count_size == current_size):
+                return max(self.newline_count_cache - 1, 0)
+
+            # File has changed - count only the appended tail when possible
+            newlines = self._get_incremental_line_count(current_size) if same_file else None
 
-            # Full file count (for small files or when incremental fails)
-            with open(self.csv_path, 'r') as f:
-                count = sum(1 for _ in f) - 1  # Subtract header
+            if newlines is None:
+                # Full file count (first call, or the file shrank or was replaced)
+                with open(self.csv_path, 'rb', buffering=0) as f:
+                    newlines = self._count_newlines(f)
+                    self.last_file_position = f.tell()  # Track position for next incremental
 
             # Update cache
-            self.line_count_cache = count
+            self.newline_count_cache = newlines
             self.line_count_mtime = current_mtime
-            self.last_file_position = current_size  # Track position for next incremental
+            self.line_count_size = current_size
+            self.line_count_file = current_file
 
-            return count
+            return max(newlines - 1, 0)  # Subtract header (if any)
 
         except Exception as e:
             # On error, return cached value if available
             print(f"[ERROR] Line count failed: {e}")
-            return self.line_count_cache if self.line_count_cache is not None else 0
+            return max(self.newline_count_cache - 1, 0) if self.newline_count_cache is not None else 0
+
+    def refresh_csv_stats(self) -> dict:
+        """Re-read CSV size and line count from disk and publish the snapshot.
+
+        A single os.stat() serves both the size and the line-count cache check.
+        """
+        with self.csv_sample_lock:
+            try:
+                stat_info = os.stat(self.csv_path)
+            except OSError:
+                stat_info = None
+
+            size_bytes = stat_info.st_size if stat_info else 0
+            stats = {
+                'size_mb': size_bytes / 1048576.0,
+                'progress_pct': min(size_bytes * 100.0 / self.target_bytes, 100.0),
+                'complete': size_bytes >= self.target_bytes,
+                'line_count': self.get_csv_line_count(stat_info) if stat_info else 0
+            }
+
+        if stats != self.csv_stats:
+            with self.status_update():
+                self.csv_stats = stats
+
+        return stats
+
+    @contextlib.contextmanager
+    def status_update(self):
+        """Hold status_lock while changing status, then wake /api/events streams."""
+        with self.status_changed:
+            yield
+            self._publish_status_snapshot()
+            self.status_version += 1
+            self.status_changed.notify_all()
+
+    def _publish_status_snapshot(self):
+        """Rebuild status_snapshot; caller must hold status_lock (or be __init__).
+
+        simulator_status and all_analyzers_status are only ever replaced, never
+        mutated, so they're shared as-is; analyzer_status is mutated per key,
+        so it gets a frozen copy.
+        """
+        self.status_snapshot = (
+            MappingProxyType(dict(self.analyzer_status)),
+            self.simulator_status,
+            self.all_analyzers_status,
+        )
+
+    def wait_for_status_change(self, seen_version: int, timeout: float) -> int:
+        """Block until the status changes after `seen_version`, or timeout.
+
+        Returns:
+            The current status version
+        """
+        with self.status_changed:
+            self.status_changed.wait_for(lambda: self.status_version != seen_version, timeout)
+            return self.status_version
+
+    def get_csv_stats(self) -> dict:
+        """Get the latest CSV stats snapshot (sampled on first use)."""
+        stats = self.csv_stats
+        if stats is None:
+            stats = self.refresh_csv_stats()
+        return stats
+
+    def _csv_sampler(self):
+        """Background loop that keeps the CSV stats snapshot current.
+
+        Wakes as soon as the CSV is written (see FileChangeWatcher), and at
+        least every CSV_SAMPLE_INTERVAL seconds where change events aren't
+        available.
+        """
+        watcher = None
+        while True:
+            try:
+                self.refresh_csv_stats()
+            except Exception as e:
+                print(f"[ERROR] CSV sampler failed: {e}")
+
+            # (Re)watch the CSV's directory, which changes with update_csv_path
+            # and may not exist until the simulator first runs
+            csv_dir, csv_name = os.path.split(os.path.abspath(self.csv_path))
+            if watcher is None or not watcher.active or watcher.directory != csv_dir:
+                if watcher is not None:
+                    watcher.close()
+                watcher = FileChangeWatcher(csv_dir)
+
+            if watcher.wait(self.CSV_SAMPLE_INTERVAL, names={csv_name}):
+                # Let a burst of writes settle into one refresh
+                time.sleep(self.CSV_EVENT_COALESCE)
+
+    def _report_watcher(self):
+        """Background loop that invalidates the report cache when a report changes.
+
+        Also wakes /api/events streams, so a finished report shows up at once.
+        Where change events aren't available, or the watch was lost because
+        the directory was deleted or moved, it retries now and then, and
+        check_report_status keeps validating its cache itself.
+        """
+        watcher = None
+        while True:
+            if watcher is None or not watcher.active:
+                watcher = FileChangeWatcher(self.report_dir)
+                self.report_watch_active = watcher.active
+
+            if watcher.wait(self.CSV_SAMPLE_INTERVAL, names=self.REPORT_FILENAMES):
+                if not watcher.active:
+                    # The directory was deleted or moved: validate the cache
+                    # by directory mtime until it is watched again
+                    self.report_watch_active = False
+                # Let a report finish being written before it is re-read
+                time.sleep(self.CSV_EVENT_COALESCE)
+                with self.status_update():
+                    self.report_generation += 1
 
     def check_report_status(self) -> dict:
         """Check which reports exist in the report directory.
 
         Uses caching to avoid repeated filesystem checks (reports don't change frequently).
-        Cache is valid for REPORT_CACHE_TTL seconds.
+        While the report watcher is active (see _report_watcher) the cache is
+        valid until it reports a change, so an idle check touches no files.
+        Otherwise a single stat of the report directory decides whether the cache
+        is still valid: reports being created or deleted change the directory
+        mtime and are picked up immediately. Reports rewritten in place don't
+        touch the directory, so their sizes are refreshed at least every
+        REPORT_CACHE_TTL seconds.
         """
+        watched = self.report_watch_active
+        if watched:
+            # Read before scanning, so a change during the scan invalidates it
+            cache_key = ('watch', self.report_generation)
+        else:
+            try:
+                cache_key = os.stat(self.report_dir).st_mtime_ns
+            except OSError:
+                cache_key = None
+
         # Return cached value if still valid
         current_time = time.time()
         if (self.report_status_cache is not None and
             self.report_cache_time is not None and
-            current_time - self.report_cache_time < self.REPORT_CACHE_TTL):
+            self.report_cache_key == cache_key and
+            (watched or current_time - self.report_cache_time < self.REPORT_CACHE_TTL)):
             return self.report_status_cache
 
-        # Cache expired or doesn't exist - check filesystem
-        reports = {
-            'understanding.html': 'Understanding Usage & Cost',
-            'performance.html': 'Performance Tracking',
-            'realtime.html': 'Real-Time Decision Making',
-            'optimization.html': 'Rate Optimization',
-            'alignment.html': 'Organizational Alignment',
-            'profitability.html': 'Customer Profitability',
-            'pricing.html': 'Pricing Strategy',
-            'features.html': 'Feature Economics'
-        }
-
-        status = {}
-        for filename, name in reports.items():
-            filepath = os.path.join(self.report_dir, filename)
-            # Use try/except to batch the exists/size check
-            try:
-                size_kb = os.path.getsize(filepath) / 1024
-                status[filename] = {
-                    'name': name,
-                    'exists': True,
-                    'size_kb': size_kb
-                }
-            except FileNotFoundError:
-                status[filename] = {
+        # Cache expired or doesn't exist - read the whole directory in one pass
+        found = {}
+        try:
+            with os.scandir(self.report_dir) as entries:
+                for entry in entries:
+                    if entry.name in self.REPORT_FILENAMES:
+                        found[entry.name] = entry.stat().st_size
+        except OSError:
+            pass  # Report directory not created yet
+
+        # Sizes in REPORTS order (None = missing); the nested response dict is
+        # only rebuilt when one of them actually changed
+        sizes = tuple(found.get(filename) for filename, _ in self.REPORTS)
+        if sizes == self.report_sizes and self.report_status_cache is not None:
+            status = self.report_status_cache
+        else:
+            status = {
+                filename: {
                     'name': name,
-                    'exists': False,
-                    'size_kb': 0
+                    'exists': size is not None,
+                    'size_kb': size / 1024 if size is not None else 0
                 }
+                for (filename, name), size in zip(self.REPORTS, sizes)
+            }
+            self.report_sizes = sizes
 
         # Update cache
         self.report_status_cache = status
         self.report_cache_time = current_time
+        self.report_cache_key = cache_key
 
         return status
 
+    def compress_file(self, path: str) -> Optional[str]:
+        """Get a gzip copy of a served file, (re)creating it if out of date.
+
+        The .gz file carries the source's mtime, so a report rewritten by an
+        analyzer (even mid-compression) is recompressed on the next request.
+
+        Returns:
+            Path to the .gz file, or None if `path` isn't a regular file or the
+            copy couldn't be written
+        """
+        try:
+            src_stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(src_stat.st_mode):
+            return None
+
+        gz_path = path + '.gz'
+        try:
+            try:
+                if os.stat(gz_path).st_mtime_ns == src_stat.st_mtime_ns:
+                    return gz_path
+            except FileNotFoundError:
+                pass
+
+            # Write to a private temp file so concurrent requests never see a partial .gz.
+            # No name or timestamp in the gzip header: the same source always
+            # compresses to the same bytes
+            tmp_path = f'{gz_path}.{threading.get_ident()}.tmp'
+            with open(path, 'rb') as src, open(tmp_path, 'wb') as raw, \
+                    gzip.GzipFile(filename='', mode='wb', fileobj=raw,
+                                  compresslevel=6, mtime=0) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.utime(tmp_path, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            os.replace(tmp_path, gz_path)
+            return gz_path
+        except OSError as e:
+            print(f"[ERROR] Compressing {path} failed: {e}")
+            return None
+
+    def compress_directory(self, directory: str):
+        """Pre-compress every servable text file so the first view doesn't pay for it."""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(COMPRESSIBLE_SUFFIXES) and entry.is_file():
+                        self.compress_file(entry.path)
+        except OSError:
+            pass  # Directory not created yet
+
     def get_status_json(self) -> dict:
         """Get current status as JSON.
 
-        Optimized to minimize filesystem calls by batching operations.
+        CSV stats come from the background sampler snapshot, so this never
+        touches the CSV itself.
         """
-        # Get CSV stats efficiently (line_count internally uses stat, no need for separate call)
-        line_count = self.get_csv_line_count()
-        csv_size_mb = self.get_csv_size_mb()
+        csv_stats = self.get_csv_stats()
 
-        with self.status_lock:
-            analyzer_status_copy = self.analyzer_status.copy()
-            simulator_status_copy = self.simulator_status.copy()
-            all_analyzers_status_copy = self.all_analyzers_status.copy()
+        analyzer_status, simulator_status, all_analyzers_status = self.status_snapshot
 
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),  # Unix epoch seconds; formatted by the client
             'csv': {
-                'size_mb': round(csv_size_mb, 2),
+                'size_mb': round(csv_stats['size_mb'], 2),
                 'target_mb': self.target_size_mb,
-                'progress_pct': min((csv_size_mb / self.target_size_mb) * 100, 100),
-                'line_count': line_count,
-                'complete': csv_size_mb >= self.target_size_mb
+                'progress_pct': csv_stats['progress_pct'],
+                'line_count': csv_stats['line_count'],
+                'complete': csv_stats['complete']
             },
             'reports': self.check_report_status(),
-            'analyzer_status': analyzer_status_copy,
-            'simulator_status': simulator_status_copy,
-            'all_analyzers_status': all_analyzers_status_copy
+            'analyzer_status': analyzer_status,
+            'simulator_status': simulator_status,
+            'all_analyzers_status': all_analyzers_status
         }
 
+    def get_status_payload(self) -> tuple:
+        """Get the encoded /api/status body and its ETag.
+
+        The last payload is reused outright while no status_update() has
+        happened since it was built (and, when report changes aren't watched,
+        for at most STATUS_PAYLOAD_TTL seconds), so concurrent pollers share
+        one build. A rebuilt status is re-serialized only when it differs from
+        the last one, so it usually costs a dict comparison instead of a JSON
+        encode and hash. The body excludes the timestamp; the ETag covers the rest.
+
+        Returns:
+            (body bytes, etag)
+        """
+        cached = self.status_payload_cache
+        if self._status_payload_fresh(cached):
+            return cached[1], cached[2]
+
+        with self.status_payload_lock:
+            # Another request may have rebuilt it while we waited
+            cached = self.status_payload_cache
+            if self._status_payload_fresh(cached):
+                return cached[1], cached[2]
+
+            # Read before building, so a change during the build forces another
+            version = self.status_version
+            status = self.get_status_json()
+            del status['timestamp']
+
+            if cached is not None and cached[0] == status:
+                body, etag = cached[1], cached[2]
+            else:
+                body = self._encode_status(status)
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+            self.status_payload_cache = (status, body, etag, version, time.monotonic())
+            return body, etag
+
+    def _encode_status(self, status: dict) -> bytes:
+        """Encode a status dict as compact JSON, section by section.
+
+        Everything except 'csv' is shared between builds until it changes
+        (report status is cached, the rest comes from status_snapshot, and
+        none of it is mutated in place), so a section that is the same
+        object as last time reuses its encoding. Caller must hold
+        status_payload_lock.
+        """
+        parts = []
+        for key, value in status.items():
+            cached = self.status_section_cache.get(key)
+            if cached is None or cached[0] is not value:
+                cached = (value, dumps_compact(value))
+                self.status_section_cache[key] = cached
+            parts.append(b'"%s":%s' % (key.encode(), cached[1]))
+        return b'{' + b','.join(parts) + b'}'
+
+    def _status_payload_fresh(self, cached) -> bool:
+        """Whether a status_payload_cache entry can be served without a rebuild."""
+        return (cached is not None and
+                cached[3] == self.status_version and
+                (self.report_watch_active or
+                 time.monotonic() - cached[4] < self.STATUS_PAYLOAD_TTL))
+
     def list_csv_files(self) -> dict:
         """List all CSV files in the src/data directory.
 
@@ -250,7 +810,10 @@ class StatusViewerServer:
             data_dir = os.path.join(os.path.dirname(__file__), '..', 'src', 'data')
 
             # Check if data directory exists
-            if not os.path.exists(data_dir):
+            try:
+                with os.scandir(data_dir) as it:
+                    entries = [entry for entry in it if entry.name.endswith('.csv')]
+            except FileNotFoundError:
                 return {
                     'success': False,
                     'error': 'Data directory not found',
@@ -258,24 +821,24 @@ class StatusViewerServer:
                 }
 
             # List all CSV files
+            current_path = os.path.abspath(self.csv_path)
             csv_files = []
-            for filename in os.listdir(data_dir):
-                if filename.endswith('.csv'):
-                    filepath = os.path.join(data_dir, filename)
-                    try:
-                        stat_info = os.stat(filepath)
-                        size_mb = stat_info.st_size / (1024 * 1024)
-                        mtime = datetime.fromtimestamp(stat_info.st_mtime)
-
-                        csv_files.append({
-                            'filename': filename,
-                            'size_mb': round(size_mb, 2),
-                            'modified': mtime.isoformat(),
-                            'modified_display': mtime.strftime('%Y-%m-%d %H:%M:%S'),
-                            'is_current': os.path.abspath(filepath) == os.path.abspath(self.csv_path)
-                        })
-                    except Exception as e:
-                        print(f"[WARNING] Failed to get stats for {filename}: {e}")
+            for entry in entries:
+                filepath = entry.path
+                try:
+                    stat_info = entry.stat()
+                    size_mb = stat_info.st_size / (1024 * 1024)
+                    mtime = datetime.fromtimestamp(stat_info.st_mtime)
+
+                    csv_files.append({
+                        'filename': entry.name,
+                        'size_mb': round(size_mb, 2),
+                        'modified': mtime.isoformat(),
+                        'modified_display': mtime.strftime('%Y-%m-%d %H:%M:%S'),
+                        'is_current': os.path.abspath(filepath) == current_path
+                    })
+                except Exception as e:
+                    print(f"[WARNING] Failed to get stats for {entry.name}: {e}")
 
             # Sort by modification time (newest first)
             csv_files.sort(key=lambda x: x['modified'], reverse=True)
@@ -319,26 +882,30 @@ class StatusViewerServer:
                 'error': error_msg
             }
 
-        # Update the CSV path
-        old_path = self.csv_path
-        self.csv_path = new_csv_path
-
-        # Reset caches when loading new CSV
-        self.line_count_cache = None
-        self.line_count_mtime = None
-        self.last_file_position = 0
-        self.report_status_cache = None
-        self.report_cache_time = None
+        # Update the CSV path (under the sample lock so the background
+        # sampler never mixes caches from the old and new file)
+        with self.csv_sample_lock:
+            old_path = self.csv_path
+            self.csv_path = new_csv_path
+
+            # Reset caches when loading new CSV
+            self.newline_count_cache = None
+            self.line_count_mtime = None
+            self.line_count_size = None
+            self.line_count_file = None
+            self.last_file_position = 0
+            self.report_status_cache = None
+            self.report_cache_time = None
+            self.report_cache_key = None
 
         # Log success
         print(f"[INFO] CSV loaded successfully: {csv_filename}")
         print(f"[INFO] Previous path: {old_path}")
         print(f"[INFO] New path: {new_csv_path}")
 
-        # Get and log initial stats
-        size_mb = self.get_csv_size_mb()
-        line_count = self.get_csv_line_count()
-        print(f"[INFO] CSV size: {size_mb:.2f} MB, Lines: {line_count:,}")
+        # Resample immediately so the next status poll reflects the new file
+        stats = self.refresh_csv_stats()
+        print(f"[INFO] CSV size: {stats['size_mb']:.2f} MB, Lines: {stats['line_count']:,}")
 
         return {
             'success': True,
@@ -346,20 +913,109 @@ class StatusViewerServer:
             'csv_path': new_csv_path
         }
 
-    def run_simulators_async(self):
-        """Run all simulators in a background thread."""
+    OUTPUT_TAIL_LINES = 1000  # Lines of subprocess output kept in memory per stream
+    OUTPUT_DRAIN_TIMEOUT = 5  # Seconds to wait for a finished script's pipes to close
+
+    def run_script(self, args: list, cwd: str, log_name: str, timeout: int,
+                   on_stdout_line=None) -> subprocess.CompletedProcess:
+        """Run a simulator/analyzer script without buffering all of its output.
+
+        stdout and stderr are drained line by line into bounded deques, so a
+        chatty analyzer can't grow the server's memory; the full stderr is
+        also written to logs/<log_name>.stderr.log. The script runs with
+        unbuffered output, so on_stdout_line (if given) sees each stdout line
+        as it is printed.
+
+        Returns:
+            CompletedProcess whose stdout/stderr hold only the last
+            OUTPUT_TAIL_LINES lines of each stream
+
+        The script runs in its own session, so a timeout kills its worker
+        processes too. Output is collected for at most OUTPUT_DRAIN_TIMEOUT
+        seconds after the script exits, in case something it started still
+        holds the pipes open.
+
+        Raises:
+            subprocess.TimeoutExpired: the process was killed after `timeout` seconds
+        """
+        os.makedirs(LOG_DIR, exist_ok=True)
+        log_path = os.path.join(LOG_DIR, f'{os.path.basename(log_name)}.stderr.log')
+
+        stdout_tail = collections.deque(maxlen=self.OUTPUT_TAIL_LINES)
+        stderr_tail = collections.deque(maxlen=self.OUTPUT_TAIL_LINES)
+
+        def drain(pipe, tail, log=None, on_line=None):
+            # Each reader closes its own pipe (and the log), so one left
+            # behind by the OUTPUT_DRAIN_TIMEOUT doesn't block the caller
+            with pipe, (log if log is not None else contextlib.nullcontext()):
+                for line in pipe:
+                    tail.append(line)
+                    if log is not None:
+                        log.write(line)
+                    if on_line is not None:
+                        try:
+                            on_line(line)
+                        except Exception as e:
+                            print(f"[WARNING] Output handler failed: {e}")
+
+        env = dict(os.environ, PYTHONUNBUFFERED='1')
+        log = open(log_path, 'w')
+        try:
+            proc = subprocess.Popen(
+                args, cwd=cwd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, errors='replace', start_new_session=True)
+        except BaseException:
+            log.close()
+            raise
+
+        readers = [
+            threading.Thread(target=drain, args=(proc.stdout, stdout_tail, None, on_stdout_line), daemon=True),
+            threading.Thread(target=drain, args=(proc.stderr, stderr_tail, log), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            # Kill the whole session: multiprocessing workers would otherwise
+            # outlive the script and keep its pipes open
+            if hasattr(os, 'killpg'):
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except OSError:
+                    proc.kill()
+            else:
+                proc.kill()
+            proc.wait()
+            raise
+        finally:
+            deadline = time.monotonic() + self.OUTPUT_DRAIN_TIMEOUT
+            for reader in readers:
+                reader.join(max(deadline - time.monotonic(), 0))
+
+        return subprocess.CompletedProcess(args, proc.returncode,
+                                           ''.join(stdout_tail), ''.join(stderr_tail))
+
+    def run_simulators_async(self) -> bool:
+        """Run all simulators in a background thread.
+
+        Returns:
+            False if the simulators are already queued or running
+        """
+        # Mark as running up front so repeat clicks don't start a second run
+        with self.status_update():
+            if self.simulator_status.get('status') == 'running':
+                return False
+            self.simulator_status = {
+                'status': 'running',
+                'message': 'Running data simulators...',
+                'started_at': datetime.now().isoformat(),
+                'completed_at': None
+            }
+
         def run():
             print(f"[INFO] Starting all simulators")
 
-            # Update status to running
-            with self.status_lock:
-                self.simulator_status = {
-                    'status': 'running',
-                    'message': 'Running data simulators...',
-                    'started_at': datetime.now().isoformat(),
-                    'completed_at': None
-                }
-
             try:
                 # Get the path to run_all_simulators.py
                 src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
@@ -369,11 +1025,10 @@ class StatusViewerServer:
                 print(f"[INFO] Working directory: {src_dir}")
 
                 # Run the simulators script
-                result = subprocess.run(
+                result = self.run_script(
                     [sys.executable, run_simulators_path],
                     cwd=src_dir,
-                    capture_output=True,
-                    text=True,
+                    log_name='run_all_simulators',
                     timeout=600  # 10 minute timeout
                 )
 
@@ -383,7 +1038,7 @@ class StatusViewerServer:
                         print(f"[OUTPUT] {result.stdout.strip()}")
 
                     # Update status to complete
-                    with self.status_lock:
+                    with self.status_update():
                         self.simulator_status = {
                             'status': 'complete',
                             'message': 'Simulators completed successfully',
@@ -398,7 +1053,7 @@ class StatusViewerServer:
                         print(f"[STDOUT] {result.stdout.strip()}")
 
                     # Update status to error
-                    with self.status_lock:
+                    with self.status_update():
                         self.simulator_status = {
                             'status': 'error',
                             'message': f'Simulators failed: {result.stderr[:100] if result.stderr else "Unknown error"}',
@@ -408,7 +1063,7 @@ class StatusViewerServer:
 
             except subprocess.TimeoutExpired:
                 print(f"[ERROR] Simulators timed out after 10 minutes")
-                with self.status_lock:
+                with self.status_update():
                     self.simulator_status = {
                         'status': 'error',
                         'message': 'Simulators timed out after 10 minutes',
@@ -418,7 +1073,7 @@ class StatusViewerServer:
             except Exception as e:
                 print(f"[ERROR] Exception running simulators: {str(e)}")
                 print(f"[ERROR] Exception type: {type(e).__name__}")
-                with self.status_lock:
+                with self.status_update():
                     self.simulator_status = {
                         'status': 'error',
                         'message': f'Error: {str(e)}',
@@ -427,26 +1082,50 @@ class StatusViewerServer:
                     }
 
         # Start simulators in background thread
-        thread = threading.Thread(target=run, daemon=True)
-        thread.start()
+        self.script_executor.submit(run)
+        return True
 
-    def run_all_analyzers_async(self):
-        """Run all analyzers in a background thread with progress tracking."""
-        def run():
-            print(f"[INFO] Starting all analyzers")
+    # Per-report progress lines printed by run_all_analyzers.py, e.g.
+    # "[3/8] ✓ Generated: Rate Optimization" or "[3/8] Generating: ..."
+    ANALYZER_PROGRESS_LINE = re.compile(r'\[(\d+)/(\d+)\] (.+)')
 
-            # Update status to running
-            with self.status_lock:
+    def run_all_analyzers_async(self) -> bool:
+        """Run all analyzers in a background thread with progress tracking.
+
+        Returns:
+            False if the analyzers are already queued or running
+        """
+        def track_progress(line):
+            match = self.ANALYZER_PROGRESS_LINE.match(line)
+            if match is None:
+                return
+            index, total, detail = int(match[1]), int(match[2]), match[3].strip()
+            with self.status_update():
                 self.all_analyzers_status = {
-                    'status': 'running',
-                    'current': 'Initializing...',
-                    'completed': 0,
-                    'total': 8,
-                    'message': 'Starting all analyzers...',
-                    'started_at': datetime.now().isoformat(),
-                    'completed_at': None
+                    **self.all_analyzers_status,
+                    'current': detail,
+                    # "Generating" announces report `index`; anything else reports it done
+                    'completed': index - 1 if detail.startswith('Generating') else index,
+                    'total': total
                 }
 
+        # Mark as running up front so repeat clicks don't start a second run
+        with self.status_update():
+            if self.all_analyzers_status.get('status') == 'running':
+                return False
+            self.all_analyzers_status = {
+                'status': 'running',
+                'current': 'Initializing...',
+                'completed': 0,
+                'total': None,
+                'message': 'Starting all analyzers...',
+                'started_at': datetime.now().isoformat(),
+                'completed_at': None
+            }
+
+        def run():
+            print(f"[INFO] Starting all analyzers")
+
             try:
                 # Get the path to run_all_analyzers.py
                 src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
@@ -456,12 +1135,12 @@ class StatusViewerServer:
                 print(f"[INFO] Working directory: {src_dir}")
 
                 # Run the analyzers script
-                result = subprocess.run(
+                result = self.run_script(
                     [sys.executable, run_all_analyzers_path],
                     cwd=src_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minute timeout
+                    log_name='run_all_analyzers',
+                    timeout=600,  # 10 minute timeout
+                    on_stdout_line=track_progress
                 )
 
                 if result.returncode == 0:
@@ -469,13 +1148,16 @@ class StatusViewerServer:
                     if result.stdout:
                         print(f"[OUTPUT] {result.stdout.strip()}")
 
+                    self.compress_directory(self.report_dir)
+
                     # Update status to complete
-                    with self.status_lock:
+                    with self.status_update():
+                        total = self.all_analyzers_status.get('total')
                         self.all_analyzers_status = {
                             'status': 'complete',
                             'current': None,
-                            'completed': 8,
-                            'total': 8,
+                            'completed': total if total is not None else self.all_analyzers_status.get('completed', 0),
+                            'total': total,
                             'message': 'All analyzers completed successfully',
                             'started_at': self.all_analyzers_status['started_at'],
                             'completed_at': datetime.now().isoformat()
@@ -488,12 +1170,12 @@ class StatusViewerServer:
                         print(f"[STDOUT] {result.stdout.strip()}")
 
                     # Update status to error
-                    with self.status_lock:
+                    with self.status_update():
                         self.all_analyzers_status = {
                             'status': 'error',
                             'current': None,
                             'completed': self.all_analyzers_status.get('completed', 0),
-                            'total': 8,
+                            'total': self.all_analyzers_status.get('total'),
                             'message': f'Analyzers failed: {result.stderr[:100] if result.stderr else "Unknown error"}',
                             'started_at': self.all_analyzers_status['started_at'],
                             'completed_at': datetime.now().isoformat()
@@ -501,12 +1183,12 @@ class StatusViewerServer:
 
             except subprocess.TimeoutExpired:
                 print(f"[ERROR] Analyzers timed out after 10 minutes")
-                with self.status_lock:
+                with self.status_update():
                     self.all_analyzers_status = {
                         'status': 'error',
                         'current': None,
                         'completed': self.all_analyzers_status.get('completed', 0),
-                        'total': 8,
+                        'total': self.all_analyzers_status.get('total'),
                         'message': 'Analyzers timed out after 10 minutes',
                         'started_at': self.all_analyzers_status['started_at'],
                         'completed_at': datetime.now().isoformat()
@@ -514,104 +1196,194 @@ class StatusViewerServer:
             except Exception as e:
                 print(f"[ERROR] Exception running analyzers: {str(e)}")
                 print(f"[ERROR] Exception type: {type(e).__name__}")
-                with self.status_lock:
+                with self.status_update():
                     self.all_analyzers_status = {
                         'status': 'error',
                         'current': None,
                         'completed': self.all_analyzers_status.get('completed', 0),
-                        'total': 8,
+                        'total': self.all_analyzers_status.get('total'),
                         'message': f'Error: {str(e)}',
                         'started_at': self.all_analyzers_status.get('started_at'),
                         'completed_at': datetime.now().isoformat()
                     }
 
         # Start analyzers in background thread
-        thread = threading.Thread(target=run, daemon=True)
-        thread.start()
+        self.script_executor.submit(run)
+        return True
+
+    def get_analyzer_pool(self) -> ProcessPoolExecutor:
+        """Get the analyzer process pool, (re)creating it if needed.
+
+        Workers are spawned rather than forked: forking a threaded server
+        can copy locks held by other threads.
+        """
+        with self.analyzer_pool_lock:
+            if self.analyzer_pool is None:
+                src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+                self.analyzer_pool = ProcessPoolExecutor(
+                    max_workers=self.ANALYZER_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_analyzer_worker,
+                    initargs=(src_dir,)
+                )
+            return self.analyzer_pool
 
-    def run_analyzer_async(self, analyzer_id: str):
-        """Run an analyzer in a background thread.
+    def warm_analyzer_pool(self):
+        """Start the analyzer workers in the background so the first analyzer
+        run doesn't pay for interpreter startup and the pandas import.
+
+        This keeps ANALYZER_WORKERS spawned processes, each with pandas and
+        the analyzer modules imported, resident for the server's lifetime,
+        even if no single analyzer is ever run. close() releases them.
+        """
+        def warm():
+            try:
+                pool = self.get_analyzer_pool()
+                futures = [pool.submit(_warm_analyzer_worker) for _ in range(self.ANALYZER_WORKERS)]
+                for future in futures:
+                    future.result()
+            except Exception as e:
+                print(f"[WARNING] Could not start analyzer workers: {e}")
+
+        self.analyzer_executor.submit(warm)
+
+    def _discard_analyzer_pool(self, pool: ProcessPoolExecutor, terminate: bool = False):
+        """Stop handing out `pool`, so get_analyzer_pool() builds a fresh one.
+
+        Args:
+            pool: The pool to drop (a no-op if it was already replaced)
+            terminate: Also kill its worker processes, ending whatever they run
+        """
+        with self.analyzer_pool_lock:
+            if self.analyzer_pool is pool:
+                self.analyzer_pool = None
+        if terminate:
+            # ProcessPoolExecutor has no public way to stop a running task
+            for process in list((getattr(pool, '_processes', None) or {}).values()):
+                process.terminate()
+            pool.shutdown(wait=False)
+
+    def close(self):
+        """Stop accepting script and analyzer runs and release the analyzer workers.
+
+        Doesn't wait for work already started.
+        """
+        self.script_executor.shutdown(wait=False)
+        self.analyzer_executor.shutdown(wait=False)
+        with self.analyzer_pool_lock:
+            pool, self.analyzer_pool = self.analyzer_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _prune_analyzer_status(self):
+        """Drop analyzer entries that finished over ANALYZER_STATUS_TTL ago.
+
+        Caller must hold status_lock.
+        """
+        cutoff = time.time() - self.ANALYZER_STATUS_TTL
+        for analyzer_id, entry in list(self.analyzer_status.items()):
+            finished_at = entry.get('completed_at') or entry.get('failed_at')
+            if finished_at and datetime.fromisoformat(finished_at).timestamp() < cutoff:
+                del self.analyzer_status[analyzer_id]
+
+    def run_analyzer_async(self, analyzer_id: str) -> bool:
+        """Queue an analyzer run on the analyzer thread pool.
 
         Args:
             analyzer_id: ID of the analyzer to run (e.g., 'understanding')
+
+        Returns:
+            False if that analyzer is already queued or running
+
+        Raises:
+            ValueError: analyzer_id is not a known analyzer
         """
+        if analyzer_id not in self.ANALYZER_IDS:
+            raise ValueError(f"Unknown analyzer: {analyzer_id}")
+
+        # Mark as reprocessing up front so repeat clicks while it waits for a
+        # worker don't queue it twice
+        with self.status_update():
+            self._prune_analyzer_status()
+            current = self.analyzer_status.get(analyzer_id)
+            if current is not None and current['status'] == 'reprocessing':
+                return False
+            self.analyzer_status[analyzer_id] = {
+                'status': 'reprocessing',
+                'started_at': datetime.now().isoformat()
+            }
+
         def run():
             print(f"[INFO] Starting analyzer: {analyzer_id}")
 
-            # Update status to reprocessing
-            with self.status_lock:
-                self.analyzer_status[analyzer_id] = {
-                    'status': 'reprocessing',
-                    'started_at': datetime.now().isoformat()
-                }
-
             try:
-                # Get the path to run_analyzer.py (one level up from viewer/)
-                src_dir = os.path.join(os.path.dirname(__file__), '..', 'src')
-                run_analyzer_path = os.path.join(src_dir, 'run_analyzer.py')
-
-                print(f"[INFO] Executing: {sys.executable} {run_analyzer_path} {analyzer_id}")
-                print(f"[INFO] Working directory: {src_dir}")
+                # Run the analyzer in a warm worker process
+                pool = self.get_analyzer_pool()
+                future = pool.submit(_run_analyzer_in_worker, analyzer_id)
+                result = future.result(timeout=self.ANALYZER_TIMEOUT)
 
-                # Run the analyzer script
-                result = subprocess.run(
-                    [sys.executable, run_analyzer_path, analyzer_id],
-                    cwd=src_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=300  # 5 minute timeout
-                )
-
-                if result.returncode == 0:
+                if result['success']:
                     # Success
-                    print(f"[SUCCESS] Analyzer completed: {analyzer_id}")
-                    if result.stdout:
-                        print(f"[OUTPUT] {result.stdout.strip()}")
+                    print(f"[SUCCESS] Analyzer completed: {analyzer_id} ({result['size_kb']:.1f} KB)")
+
+                    self.compress_directory(self.report_dir)
 
-                    with self.status_lock:
+                    with self.status_update():
                         self.analyzer_status[analyzer_id] = {
                             'status': 'complete',
                             'completed_at': datetime.now().isoformat()
                         }
                 else:
                     # Error
-                    print(f"[ERROR] Analyzer failed: {analyzer_id} (exit code: {result.returncode})")
-                    if result.stderr:
-                        print(f"[STDERR] {result.stderr.strip()}")
-                    if result.stdout:
-                        print(f"[STDOUT] {result.stdout.strip()}")
+                    print(f"[ERROR] Analyzer failed: {analyzer_id}: {result['error']}")
+                    print(f"[TRACEBACK] {result['traceback'].strip()}")
 
-                    with self.status_lock:
+                    with self.status_update():
                         self.analyzer_status[analyzer_id] = {
                             'status': 'error',
-                            'error': result.stderr,
+                            'error': result['error'],
                             'failed_at': datetime.now().isoformat()
                         }
 
-            except subprocess.TimeoutExpired:
-                error_msg = 'Analyzer timed out after 5 minutes'
+            except FutureTimeoutError:
+                # A task can't be cancelled once it runs, so end the worker
+                # itself; leaving it would hold a worker and keep writing the
+                # report. Any other analyzer in the pool fails as if its
+                # worker had died.
+                error_msg = f'Analyzer timed out after {self.ANALYZER_TIMEOUT} seconds'
                 print(f"[ERROR] {error_msg}: {analyzer_id}")
+                self._discard_analyzer_pool(pool, terminate=True)
 
-                with self.status_lock:
+                with self.status_update():
                     self.analyzer_status[analyzer_id] = {
                         'status': 'error',
                         'error': error_msg,
                         'failed_at': datetime.now().isoformat()
                     }
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); start a fresh pool next time
+                print(f"[ERROR] Analyzer worker process died: {analyzer_id}")
+                self._discard_analyzer_pool(pool)
+
+                with self.status_update():
+                    self.analyzer_status[analyzer_id] = {
+                        'status': 'error',
+                        'error': 'Analyzer worker process died',
+                        'failed_at': datetime.now().isoformat()
+                    }
             except Exception as e:
                 print(f"[ERROR] Exception running analyzer {analyzer_id}: {str(e)}")
                 print(f"[ERROR] Exception type: {type(e).__name__}")
 
-                with self.status_lock:
+                with self.status_update():
                     self.analyzer_status[analyzer_id] = {
                         'status': 'error',
                         'error': str(e),
                         'failed_at': datetime.now().isoformat()
                     }
 
-        # Start analyzer in background thread
-        thread = threading.Thread(target=run, daemon=True)
-        thread.start()
+        self.analyzer_executor.submit(run)
+        return True
 
     def serve(self):
         """Start the HTTP server."""
@@ -619,202 +1391,376 @@ class StatusViewerServer:
         parent = self
 
         class StatusHandler(http.server.SimpleHTTPRequestHandler):
-            def do_GET(self):
-                # Status API endpoint
-                if self.path.startswith('/api/status'):
-                    try:
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                        self.send_header('Pragma', 'no-cache')
-                        self.send_header('Expires', '0')
-                        self.end_headers()
+            # Keep connections open between polls; every response sets
+            # Content-Length (or closes the connection) so framing is unambiguous
+            protocol_version = 'HTTP/1.1'
 
-                        status = parent.get_status_json()
-                        self.wfile.write(json.dumps(status, indent=2).encode())
-                    except (BrokenPipeError, ConnectionResetError):
-                        # Client closed connection - ignore
-                        pass
-                    return
+            # Buffer writes so headers and a small body leave in one send();
+            # the buffer is flushed after each request and before sendfile
+            wbufsize = 65536
 
-                # List CSV files endpoint
-                if self.path.startswith('/api/list_csv_files'):
-                    try:
-                        print(f"[API] GET /api/list_csv_files")
+            def serve_status(self):
+                """GET /api/status"""
+                try:
+                    # An idle server answers repeat polls with an empty 304
+                    body, etag = parent.get_status_payload()
 
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                        self.send_header('Pragma', 'no-cache')
-                        self.send_header('Expires', '0')
+                    if self.headers.get('If-None-Match') == etag:
+                        self.send_response(304)
+                        self.send_header('ETag', etag)
                         self.end_headers()
-
-                        result = parent.list_csv_files()
-                        self.wfile.write(json.dumps(result, indent=2).encode())
-
-                        print(f"[API] Returned {len(result.get('files', []))} CSV files")
-                    except (BrokenPipeError, ConnectionResetError):
-                        # Client closed connection - ignore
-                        print(f"[API WARNING] Client closed connection during CSV list")
-                        pass
-                    except Exception as e:
-                        print(f"[API ERROR] Exception in list_csv_files: {str(e)}")
-                        print(f"[API ERROR] Exception type: {type(e).__name__}")
+                        return
+
+                    # Splice the fresh timestamp in front of the cached body
+                    payload = f'{{"timestamp":{time.time()!r},'.encode() + body[1:]
+
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed connection - ignore
+                    pass
+
+            def send_json(self, status_code: int, obj, etag: Optional[str] = None):
+                """Send obj as a compact JSON response.
+
+                Content-Length is always set so the connection can be kept alive.
+                With an etag, a request whose If-None-Match matches it gets an
+                empty 304 instead.
+                """
+                if etag is not None and self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
                     return
+                body = obj if isinstance(obj, bytes) else dumps_compact(obj)
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if etag is not None:
+                    self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def serve_events(self):
+                """GET /api/events - push status changes as Server-Sent Events.
+
+                Sends the full status whenever it changes and a heartbeat
+                (the server time) otherwise, so a closed tab is noticed on
+                the next write and its thread exits.
+                """
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Connection', 'close')  # The stream ends when the connection does
+                self.end_headers()
 
-                # Serve files from report directory
-                self.directory = parent.report_dir
-
-                # Add no-cache headers for HTML files
-                super().do_GET()
+                version = parent.status_version
+                last_etag = None
+                try:
+                    while True:
+                        body, etag = parent.get_status_payload()
+                        now = time.time()
+                        if etag != last_etag:
+                            self.wfile.write(f'data: {{"timestamp":{now!r},'.encode() + body[1:] + b'\n\n')
+                            last_etag = etag
+                        else:
+                            self.wfile.write(f'event: heartbeat\ndata: {now!r}\n\n'.encode())
+                        self.wfile.flush()
+
+                        version = parent.wait_for_status_change(version, parent.EVENT_RECHECK_INTERVAL)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed connection - ignore
+                    pass
+
+            def serve_csv_list(self):
+                """GET /api/list_csv_files"""
+                try:
+                    print(f"[API] GET /api/list_csv_files")
+
+                    # The page revalidates its copy; an unchanged list gets a 304
+                    result = parent.list_csv_files()
+                    body = dumps_compact(result)
+                    self.send_json(200, body, etag=f'"{hashlib.md5(body).hexdigest()}"')
+
+                    print(f"[API] Returned {len(result.get('files', []))} CSV files")
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed connection - ignore
+                    print(f"[API WARNING] Client closed connection during CSV list")
+                    pass
+                except Exception as e:
+                    print(f"[API ERROR] Exception in list_csv_files: {str(e)}")
+                    print(f"[API ERROR] Exception type: {type(e).__name__}")
+                    self.close_connection = True  # Response may be missing or incomplete
+
+            # API endpoints by exact path (query string stripped); anything
+            # else falls through to static file serving
+            GET_ROUTES = {
+                '/api/status': serve_status,
+                '/api/events': serve_events,
+                '/api/list_csv_files': serve_csv_list,
+            }
 
-            def do_POST(self):
-                # Load CSV endpoint
-                if self.path.startswith('/api/load_csv'):
-                    try:
-                        # Parse csv_filename from query string
-                        parsed = urlparse(self.path)
-                        params = parse_qs(parsed.query)
-                        csv_filename = params.get('csv_filename', [None])[0]
-
-                        print(f"[API] POST /api/load_csv - Filename: {csv_filename}")
-
-                        if not csv_filename:
-                            print(f"[API ERROR] Missing csv_filename parameter")
-                            self.send_response(400)
-                            self.send_header('Content-Type', 'application/json')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'success': False,
-                                'error': 'Missing csv_filename parameter'
-                            }).encode())
-                            return
+            def parse_request(self):
+                # Per-request defaults; the handler is reused across requests
+                # on a keep-alive connection
+                self.directory = parent.report_dir
+                self.cache_headers = self.NO_CACHE_HEADERS
+                self.vary_headers = b''
+                return super().parse_request()
 
-                        # Update CSV path
-                        result = parent.update_csv_path(csv_filename)
+            def do_GET(self):
+                route = self.GET_ROUTES.get(self.path.split('?', 1)[0])
+                if route is not None:
+                    return route(self)
 
-                        # Return response
-                        status_code = 200 if result['success'] else 404
-                        print(f"[API] Response status: {status_code}, Success: {result.get('success', False)}")
+                if self.path.startswith('/static/'):
+                    # Status page assets: URLs carry a version, so they can be cached
+                    self.directory = STATIC_DIR
+                    self.path = self.path[len('/static'):]
+                    self.cache_headers = self.STATIC_CACHE_HEADERS
 
-                        self.send_response(status_code)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps(result).encode())
-                    except (BrokenPipeError, ConnectionResetError):
-                        # Client closed connection - ignore
-                        print(f"[API WARNING] Client closed connection during CSV load")
-                        pass
-                    except Exception as e:
-                        print(f"[API ERROR] Exception in load_csv: {str(e)}")
-                        print(f"[API ERROR] Exception type: {type(e).__name__}")
-                    return
+                # Serve files from report directory
+                super().do_GET()
 
-                # Run simulators endpoint
-                if self.path.startswith('/api/run_simulators'):
-                    try:
-                        print(f"[API] POST /api/run_simulators")
+            def serve_load_csv(self, params: dict):
+                """POST /api/load_csv"""
+                try:
+                    csv_filename = params.get('csv_filename', [None])[0]
 
-                        # Start simulators in background
-                        parent.run_simulators_async()
+                    print(f"[API] POST /api/load_csv - Filename: {csv_filename}")
 
-                        print(f"[API] Simulators background thread started")
+                    if not csv_filename:
+                        print(f"[API ERROR] Missing csv_filename parameter")
+                        self.send_json(400, {
+                            'success': False,
+                            'error': 'Missing csv_filename parameter'
+                        })
+                        return
 
-                        # Return immediate response
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
-                            'success': True,
-                            'message': 'Simulators started'
-                        }).encode())
-                    except (BrokenPipeError, ConnectionResetError):
-                        print(f"[API WARNING] Client closed connection during simulators start")
-                        pass
-                    except Exception as e:
-                        print(f"[API ERROR] Exception in run_simulators: {str(e)}")
-                        print(f"[API ERROR] Exception type: {type(e).__name__}")
-                    return
+                    # Update CSV path
+                    result = parent.update_csv_path(csv_filename)
 
-                # Run all analyzers endpoint
-                if self.path.startswith('/api/run_all_analyzers'):
-                    try:
-                        print(f"[API] POST /api/run_all_analyzers")
+                    # Return response
+                    status_code = 200 if result['success'] else 404
+                    print(f"[API] Response status: {status_code}, Success: {result.get('success', False)}")
 
-                        # Start all analyzers in background
-                        parent.run_all_analyzers_async()
+                    self.send_json(status_code, result)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed connection - ignore
+                    print(f"[API WARNING] Client closed connection during CSV load")
+                    pass
+                except Exception as e:
+                    print(f"[API ERROR] Exception in load_csv: {str(e)}")
+                    print(f"[API ERROR] Exception type: {type(e).__name__}")
+                    self.close_connection = True  # Response may be missing or incomplete
 
-                        print(f"[API] All analyzers background thread started")
+            def serve_run_simulators(self, params: dict):
+                """POST /api/run_simulators"""
+                try:
+                    print(f"[API] POST /api/run_simulators")
+
+                    # Start simulators in background
+                    if not parent.run_simulators_async():
+                        print(f"[API] Simulators already running")
+                        self.send_json(409, {
+                            'success': False,
+                            'error': 'Simulators already running'
+                        })
+                        return
+
+                    print(f"[API] Simulators background thread started")
+
+                    # Return immediate response
+                    self.send_json(200, {
+                        'success': True,
+                        'message': 'Simulators started'
+                    })
+                except (BrokenPipeError, ConnectionResetError):
+                    print(f"[API WARNING] Client closed connection during simulators start")
+                    pass
+                except Exception as e:
+                    print(f"[API ERROR] Exception in run_simulators: {str(e)}")
+                    print(f"[API ERROR] Exception type: {type(e).__name__}")
+                    self.close_connection = True  # Response may be missing or incomplete
 
-                        # Return immediate response
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
-                            'success': True,
-                            'message': 'All analyzers started'
-                        }).encode())
-                    except (BrokenPipeError, ConnectionResetError):
-                        print(f"[API WARNING] Client closed connection during all analyzers start")
-                        pass
-                    except Exception as e:
-                        print(f"[API ERROR] Exception in run_all_analyzers: {str(e)}")
-                        print(f"[API ERROR] Exception type: {type(e).__name__}")
-                    return
+            def serve_run_all_analyzers(self, params: dict):
+                """POST /api/run_all_analyzers"""
+                try:
+                    print(f"[API] POST /api/run_all_analyzers")
+
+                    # Start all analyzers in background
+                    if not parent.run_all_analyzers_async():
+                        print(f"[API] All analyzers already running")
+                        self.send_json(409, {
+                            'success': False,
+                            'error': 'Analyzers already running'
+                        })
+                        return
+
+                    print(f"[API] All analyzers background thread started")
+
+                    # Return immediate response
+                    self.send_json(200, {
+                        'success': True,
+                        'message': 'All analyzers started'
+                    })
+                except (BrokenPipeError, ConnectionResetError):
+                    print(f"[API WARNING] Client closed connection during all analyzers start")
+                    pass
+                except Exception as e:
+                    print(f"[API ERROR] Exception in run_all_analyzers: {str(e)}")
+                    print(f"[API ERROR] Exception type: {type(e).__name__}")
+                    self.close_connection = True  # Response may be missing or incomplete
 
-                # Run analyzer endpoint
-                if self.path.startswith('/api/run_analyzer'):
-                    try:
-                        # Parse analyzer_id from query string
-                        parsed = urlparse(self.path)
-                        params = parse_qs(parsed.query)
-                        analyzer_id = params.get('analyzer_id', [None])[0]
+            def serve_run_analyzer(self, params: dict):
+                """POST /api/run_analyzer"""
+                try:
+                    analyzer_id = params.get('analyzer_id', [None])[0]
 
-                        print(f"[API] POST /api/run_analyzer - Analyzer ID: {analyzer_id}")
+                    print(f"[API] POST /api/run_analyzer - Analyzer ID: {analyzer_id}")
 
-                        if not analyzer_id:
-                            print(f"[API ERROR] Missing analyzer_id parameter")
-                            self.send_response(400)
-                            self.send_header('Content-Type', 'application/json')
-                            self.end_headers()
-                            self.wfile.write(json.dumps({
-                                'success': False,
-                                'error': 'Missing analyzer_id parameter'
-                            }).encode())
-                            return
+                    if not analyzer_id:
+                        print(f"[API ERROR] Missing analyzer_id parameter")
+                        self.send_json(400, {
+                            'success': False,
+                            'error': 'Missing analyzer_id parameter'
+                        })
+                        return
 
-                        # Start analyzer in background
-                        parent.run_analyzer_async(analyzer_id)
+                    if analyzer_id not in parent.ANALYZER_IDS:
+                        print(f"[API ERROR] Unknown analyzer: {analyzer_id}")
+                        self.send_json(400, {
+                            'success': False,
+                            'error': f'Unknown analyzer: {analyzer_id}'
+                        })
+                        return
+
+                    # Queue analyzer in background
+                    if parent.run_analyzer_async(analyzer_id):
+                        print(f"[API] Analyzer queued: {analyzer_id}")
+                        status_code, message = 200, 'Analyzer started'
+                    else:
+                        print(f"[API] Analyzer already running: {analyzer_id}")
+                        status_code, message = 202, 'Analyzer already running'
+
+                    # Return immediate response
+                    self.send_json(status_code, {
+                        'success': True,
+                        'analyzer_id': analyzer_id,
+                        'message': message
+                    })
+                except (BrokenPipeError, ConnectionResetError):
+                    # Client closed connection - ignore
+                    print(f"[API WARNING] Client closed connection during analyzer start")
+                    pass
+                except Exception as e:
+                    print(f"[API ERROR] Exception in run_analyzer: {str(e)}")
+                    print(f"[API ERROR] Exception type: {type(e).__name__}")
+                    self.close_connection = True  # Response may be missing or incomplete
+
+            # POST endpoints by exact path; handlers get the parsed query string
+            POST_ROUTES = {
+                '/api/load_csv': serve_load_csv,
+                '/api/run_simulators': serve_run_simulators,
+                '/api/run_all_analyzers': serve_run_all_analyzers,
+                '/api/run_analyzer': serve_run_analyzer,
+            }
 
-                        print(f"[API] Analyzer background thread started: {analyzer_id}")
+            def do_POST(self):
+                # Parameters come in the query string; discard any body so the
+                # next request on this keep-alive connection parses cleanly
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
 
-                        # Return immediate response
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({
-                            'success': True,
-                            'analyzer_id': analyzer_id,
-                            'message': 'Analyzer started'
-                        }).encode())
-                    except (BrokenPipeError, ConnectionResetError):
-                        # Client closed connection - ignore
-                        print(f"[API WARNING] Client closed connection during analyzer start")
-                        pass
-                    except Exception as e:
-                        print(f"[API ERROR] Exception in run_analyzer: {str(e)}")
-                        print(f"[API ERROR] Exception type: {type(e).__name__}")
-                    return
+                parsed = urlparse(self.path)
+                route = self.POST_ROUTES.get(parsed.path)
+                if route is not None:
+                    return route(self, parse_qs(parsed.query))
 
                 # Method not allowed for other paths
                 self.send_response(405)
+                self.send_header('Content-Length', '0')
                 self.end_headers()
 
+            def send_head(self):
+                # Serve text files gzip-compressed to clients that accept it
+                path = self.translate_path(self.path)
+                if path.endswith(COMPRESSIBLE_SUFFIXES):
+                    # Both encodings of these files vary on Accept-Encoding
+                    self.vary_headers = self.VARY_HEADERS
+                    if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                        gz_path = parent.compress_file(path)
+                        if gz_path is not None:
+                            try:
+                                f = open(gz_path, 'rb')
+                            except OSError:
+                                return super().send_head()
+                            # The .gz carries its source's mtime (see compress_file)
+                            fs = os.fstat(f.fileno())
+                            if self.not_modified_since(fs.st_mtime):
+                                f.close()
+                                self.send_response(304)
+                                self.end_headers()
+                                return None
+                            self.send_response(200)
+                            self.send_header('Content-Type', self.guess_type(path))
+                            self.send_header('Content-Encoding', 'gzip')
+                            self.send_header('Content-Length', str(fs.st_size))
+                            self.send_header('Last-Modified', self.date_time_string(fs.st_mtime))
+                            self.end_headers()
+                            return f
+                return super().send_head()
+
+            def not_modified_since(self, mtime: float) -> bool:
+                """Check If-Modified-Since the way SimpleHTTPRequestHandler does.
+
+                If-None-Match takes precedence, and these files have no ETag,
+                so a request carrying it always gets the full response.
+                """
+                if ('If-Modified-Since' not in self.headers
+                        or 'If-None-Match' in self.headers):
+                    return False
+                try:
+                    since = email.utils.parsedate_to_datetime(self.headers['If-Modified-Since'])
+                except (TypeError, IndexError, OverflowError, ValueError):
+                    return False  # Ignore ill-formed values
+                if since.tzinfo is None:
+                    since = since.replace(tzinfo=timezone.utc)
+                # Last-Modified has whole-second resolution
+                return int(mtime) <= since.timestamp()
+
+            def copyfile(self, source, outputfile):
+                # Zero-copy static files from the page cache via sendfile(2);
+                # in-memory bodies (e.g. directory listings) use the default copy
+                try:
+                    source.fileno()
+                except (AttributeError, io.UnsupportedOperation):
+                    return super().copyfile(source, outputfile)
+
+                outputfile.flush()
+                self.connection.sendfile(source)
+
+            # Identical on every response, so pre-encoded once
+            NO_CACHE_HEADERS = (
+                b"Cache-Control: no-cache, no-store, must-revalidate\r\n"
+                b"Pragma: no-cache\r\n"
+                b"Expires: 0\r\n"
+            )
+            STATIC_CACHE_HEADERS = b"Cache-Control: public, max-age=3600\r\n"
+            cache_headers = NO_CACHE_HEADERS  # Chosen per request (see parse_request)
+            VARY_HEADERS = b"Vary: Accept-Encoding\r\n"
+            vary_headers = b''  # Set by send_head for files also served gzipped
+
             def end_headers(self):
-                # No-cache headers for all responses
-                self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-                self.send_header('Pragma', 'no-cache')
-                self.send_header('Expires', '0')
+                # Cache headers for all responses (HTTP/0.9 has no header block)
+                if hasattr(self, '_headers_buffer'):
+                    self._headers_buffer.append(self.cache_headers)
+                    if self.vary_headers:
+                        self._headers_buffer.append(self.vary_headers)
                 super().end_headers()
 
             def log_message(self, format, *args):
@@ -828,8 +1774,17 @@ class StatusViewerServer:
         index_path = os.path.join(self.report_dir, 'index.html')
         self.create_status_page(index_path)
         print(f"[INFO] Generated index.html at {index_path}")
+        self.compress_directory(STATIC_DIR)
+
+        # Keep CSV stats fresh in the background
+        sampler = threading.Thread(target=self._csv_sampler, name='csv-sampler', daemon=True)
+        sampler.start()
+        report_watcher = threading.Thread(target=self._report_watcher, name='report-watcher', daemon=True)
+        report_watcher.start()
+        # Trades idle memory (resident analyzer workers) for a fast first run
+        self.warm_analyzer_pool()
 
-        with socketserver.TCPServer(("", self.port), StatusHandler) as httpd:
+        with ViewerHTTPServer(("", self.port), StatusHandler) as httpd:
             print()
             print("=" * 80)
             print("REVENIUM FINOPS SHOWCASE - STATUS VIEWER")
@@ -862,6 +1817,7 @@ class StatusViewerServer:
                 httpd.serve_forever()
             except KeyboardInterrupt:
                 print("\n\nShutting down server...")
+                self.close()
                 # Clean up index.html on server stop
                 if os.path.exists(index_path):
                     os.remove(index_path)
@@ -869,46 +1825,59 @@ class StatusViewerServer:
                 print("Server stopped.")
 
     def create_static_index(self, output_path: str):
-        """Create a static index page for AWS Amplify hosting (no API calls, no live updates)."""
-        import json
-
-        # Find all HTML reports in the report directory
-        report_configs = [
-            {'filename': 'dataset_overview.html', 'title': 'Dataset Overview', 'description': 'Comprehensive statistical analysis and distribution metrics', 'category': 'Core Analytics'},
-            {'filename': 'understanding.html', 'title': 'Understanding Usage & Cost', 'description': 'High-level cost and usage patterns across the platform', 'category': 'Core Analytics'},
-            {'filename': 'performance.html', 'title': 'Performance Tracking', 'description': 'Latency analysis and SLA compliance monitoring', 'category': 'Core Analytics'},
-            {'filename': 'profitability.html', 'title': 'Customer Profitability', 'description': 'Revenue vs cost analysis by customer segment', 'category': 'Financial & Revenue Analytics'},
-            {'filename': 'pricing.html', 'title': 'Pricing Strategy', 'description': 'Pricing model effectiveness and optimization opportunities', 'category': 'Financial & Revenue Analytics'},
-            {'filename': 'features.html', 'title': 'Feature Economics', 'description': 'Cost and usage analysis by product feature', 'category': 'Financial & Revenue Analytics'},
-            {'filename': 'realtime.html', 'title': 'Real-Time Decision Making', 'description': 'Live monitoring and immediate cost visibility', 'category': 'Operational Insights'},
-            {'filename': 'optimization.html', 'title': 'Rate Optimization', 'description': 'Model selection and cost reduction opportunities', 'category': 'Operational Insights'},
-            {'filename': 'alignment.html', 'title': 'Organizational Alignment', 'description': 'Cross-team visibility and cost attribution', 'category': 'Operational Insights'},
-            {'filename': 'token_economics.html', 'title': 'Token Economics & Efficiency', 'description': 'Token usage patterns and optimization metrics', 'category': 'Advanced Analytics'},
-            {'filename': 'geographic_latency.html', 'title': 'Geographic & Latency Intelligence', 'description': 'Regional performance and infrastructure optimization', 'category': 'Advanced Analytics'},
-            {'filename': 'churn_growth.html', 'title': 'Churn Risk & Growth Signals', 'description': 'Customer health and expansion opportunities', 'category': 'Advanced Analytics'},
-            {'filename': 'abuse_detection.html', 'title': 'Abuse Detection & Security', 'description': 'Anomaly detection and usage pattern analysis', 'category': 'Advanced Analytics'}
-        ]
+        """Create a static index page for AWS Amplify hosting (no API calls, no live updates).
+
+        The page is only rebuilt when one of the files it is built from (the
+        listed reports and manifest.json) was added, removed or rewritten
+        since the last call. A gzip copy is written next to it.
+        """
+        # Stats of every file the page is built from, from one directory scan
+        present = {}
+        try:
+            with os.scandir(self.report_dir) as entries:
+                for entry in entries:
+                    if entry.name in self.STATIC_INDEX_SOURCES and entry.is_file():
+                        present[entry.name] = entry.stat()
+        except OSError:
+            pass  # Report directory not created yet
+
+        fingerprint = tuple(sorted(
+            (name, st.st_size, st.st_mtime_ns) for name, st in present.items()
+        ))
+        cached = self.static_index_cache
+        if cached is not None and cached[0] == fingerprint:
+            html = cached[1]
+        else:
+            html = self._render_static_index(present)
+            self.static_index_cache = (fingerprint, html)
+
+        write_text_atomic(output_path, html)
+        # Precompressed copy for hosts that serve .gz files as-is
+        self.compress_file(output_path)
 
+    def _render_static_index(self, present: dict) -> str:
+        """Render the static index page.
+
+        Args:
+            present: os.stat results of the listed reports and manifest.json
+                that exist, by filename
+        """
         # Check which reports exist
-        available_reports = []
-        for config in report_configs:
-            filepath = os.path.join(self.report_dir, config['filename'])
-            if os.path.exists(filepath):
-                size_kb = os.path.getsize(filepath) / 1024
-                available_reports.append({
-                    **config,
-                    'size_kb': size_kb
-                })
+        available_reports = [
+            {**config, 'size_kb': present[config['filename']].st_size / 1024}
+            for config in self.STATIC_INDEX_REPORTS
+            if config['filename'] in present
+        ]
 
         # Read manifest if available
-        manifest_path = os.path.join(self.report_dir, 'manifest.json')
         manifest = {}
-        if os.path.exists(manifest_path):
+        if 'manifest.json' in present:
             try:
-                with open(manifest_path, 'r') as f:
-                    manifest = json.load(f)
+                # Bytes straight to the parser: json detects the encoding itself
+                with open(os.path.join(self.report_dir, 'manifest.json'), 'rb') as f:
+                    manifest = json.loads(f.read())
             except Exception:
-                pass
+                pass  # Unreadable manifest: fall back to 'Unknown'
 
         generation_time = manifest.get('generated_at', 'Unknown')
         data_size_mb = manifest.get('data_size_mb', 'Unknown')
@@ -929,606 +1898,31 @@ class StatusViewerServer:
             categories[cat].append(report)
 
         # Build report cards HTML with proper emoji prefixes
-        category_emojis = {
-            'Core Analytics': '📊',
-            'Financial & Revenue Analytics': '💰',
-            'Operational Insights': '🚀',
-            'Advanced Analytics': '🔬'
-        }
-
-        report_cards_html = ''
+        report_cards = []
         for category, reports in categories.items():
-            emoji = category_emojis.get(category, '📈')
-            report_cards_html += f'<h3 class="category-header">{emoji} {category}</h3>\n'
-            report_cards_html += '<div class="report-grid">\n'
+            emoji = self.CATEGORY_EMOJIS.get(category, '📈')
+            report_cards.append(f'<h3 class="category-header">{emoji} {category}</h3>\n')
+            report_cards.append('<div class="report-grid">\n')
             for report in reports:
-                description = report.get('description', f'{report["size_kb"]:.1f} KB')
-                report_cards_html += f'''
-                <div class="report-card">
-                    <div class="status-badge complete">✓ Available</div>
-                    <h4>{report['title']}</h4>
-                    <p>{description}</p>
-                    <a href="{report['filename']}" class="view-button">View Report →</a>
-                </div>
-'''
-            report_cards_html += '</div>\n\n'
-
-        html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Revenium FinOps Showcase - Analysis Reports</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }}
-        .header h1 {{
-            font-size: 36px;
-            margin-bottom: 10px;
-        }}
-        .header p {{
-            font-size: 16px;
-            opacity: 0.8;
-        }}
-        .content {{
-            padding: 40px;
-        }}
-        .info-box {{
-            background: #e3f2fd;
-            padding: 20px;
-            border-radius: 8px;
-            border-left: 4px solid #2196f3;
-            margin-bottom: 30px;
-        }}
-        .info-box h3 {{
-            color: #1976d2;
-            margin-bottom: 10px;
-        }}
-        .info-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 15px;
-        }}
-        .info-item {{
-            background: white;
-            padding: 15px;
-            border-radius: 6px;
-        }}
-        .info-label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        .info-value {{
-            font-size: 20px;
-            font-weight: bold;
-            color: #1a1a1a;
-            margin-top: 5px;
-        }}
-        .category-header {{
-            color: #1a1a1a;
-            margin: 30px 0 20px 0;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-            font-size: 20px;
-        }}
-        .category-header:first-of-type {{
-            margin-top: 0;
-        }}
-        .report-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(280px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .report-card {{
-            background: #f1f8f4;
-            border: 2px solid #4CAF50;
-            border-radius: 8px;
-            padding: 20px;
-            transition: all 0.2s;
-            position: relative;
-        }}
-        .report-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        }}
-        .status-badge {{
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            padding: 5px 12px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-            color: white;
-            background: #4CAF50;
-        }}
-        .report-card h4 {{
-            margin-bottom: 10px;
-            color: #1a1a1a;
-            padding-right: 80px;
-            font-size: 16px;
-        }}
-        .report-card p {{
-            color: #666;
-            font-size: 14px;
-            margin-bottom: 15px;
-        }}
-        .view-button {{
-            display: inline-block;
-            background: #2196f3;
-            color: white;
-            padding: 10px 20px;
-            text-decoration: none;
-            border-radius: 4px;
-            transition: background 0.2s;
-            font-size: 14px;
-        }}
-        .view-button:hover {{
-            background: #1976d2;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            background: #f5f5f5;
-            border-radius: 8px;
-            margin-top: 30px;
-            color: #666;
-            font-size: 14px;
-        }}
-        .github-link {{
-            color: #667eea;
-            text-decoration: none;
-            font-weight: 600;
-        }}
-        .github-link:hover {{
-            text-decoration: underline;
-        }}
-        /* Executive Summary Styles */
-        .executive-summary {{
-            display: flex;
-            flex-direction: column;
-            gap: 30px;
-            margin: 40px 0;
-        }}
-        .insight-card {{
-            background: white;
-            border-radius: 12px;
-            border: 2px solid #e0e0e0;
-            overflow: hidden;
-            transition: all 0.3s;
-        }}
-        .insight-card:hover {{
-            box-shadow: 0 8px 24px rgba(0,0,0,0.12);
-            border-color: #667eea;
-        }}
-        .insight-header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 25px 30px;
-            display: flex;
-            align-items: center;
-            gap: 20px;
-        }}
-        .insight-number {{
-            background: rgba(255,255,255,0.2);
-            width: 50px;
-            height: 50px;
-            border-radius: 50%;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 24px;
-            font-weight: bold;
-            flex-shrink: 0;
-        }}
-        .insight-header h3 {{
-            margin: 0;
-            font-size: 20px;
-            font-weight: 600;
-            line-height: 1.3;
-        }}
-        .insight-content {{
-            display: grid;
-            grid-template-columns: 1.5fr 1fr;
-            gap: 30px;
-            padding: 30px;
-        }}
-        @media (max-width: 1024px) {{
-            .insight-content {{
-                grid-template-columns: 1fr;
-            }}
-        }}
-        .insight-text {{
-            display: flex;
-            flex-direction: column;
-            gap: 16px;
-        }}
-        .insight-finding {{
-            padding: 16px;
-            background: #fff3e0;
-            border-left: 4px solid #ff9800;
-            border-radius: 4px;
-            line-height: 1.6;
-        }}
-        .insight-detail {{
-            padding: 16px;
-            background: #f5f5f5;
-            border-radius: 4px;
-            line-height: 1.6;
-        }}
-        .insight-action {{
-            padding: 16px;
-            background: #e8f5e9;
-            border-left: 4px solid #4caf50;
-            border-radius: 4px;
-            line-height: 1.6;
-        }}
-        .insight-visual {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        .insight-visual canvas {{
-            max-width: 100%;
-            max-height: 400px;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Revenium FinOps Showcase</h1>
-            <p>AI Cost Management & Usage-Based Revenue Analysis</p>
-        </div>
-
-        <div class="content">
-            <div class="info-box">
-                <h3>Dataset Information</h3>
-                <div class="info-grid">
-                    <div class="info-item">
-                        <div class="info-label">Generated At</div>
-                        <div class="info-value">{generation_time}</div>
-                    </div>
-                    <div class="info-item">
-                        <div class="info-label">Data Size</div>
-                        <div class="info-value">{data_size_mb} MB</div>
-                    </div>
-                    <div class="info-item">
-                        <div class="info-label">Total API Calls</div>
-                        <div class="info-value">{total_calls}</div>
-                    </div>
-                    <div class="info-item">
-                        <div class="info-label">Reports Available</div>
-                        <div class="info-value">{len(available_reports)}</div>
-                    </div>
-                </div>
-            </div>
-
-            <h2 style="color: #1a1a1a; margin: 40px 0 20px 0; padding-bottom: 10px; border-bottom: 2px solid #e0e0e0;">Executive Summary</h2>
-            <div class="executive-summary">
-                <!-- Insight 1: Starter Tier Paradox -->
-                <div class="insight-card">
-                    <div class="insight-header">
-                        <div class="insight-number">1</div>
-                        <h3>The "Starter Tier Paradox": Inverse Economics at Scale</h3>
-                    </div>
-                    <div class="insight-content">
-                        <div class="insight-text">
-                            <div class="insight-finding">
-                                <strong>Key Metric:</strong> Starter tier ($29/month) operates at -264.6% margin with 418 expansion-ready customers representing $51,100 in untapped monthly revenue.
-                            </div>
-                            <div class="insight-detail">
-                                <strong>Business Impact:</strong> Your worst-performing segment is simultaneously your highest-value expansion pipeline. 482 starter customers generating 196-222% growth rates consume $106/customer in AI costs while paying $29—a deliberate arbitrage, not accidental usage.
-                            </div>
-                            <div class="insight-action">
-                                <strong>Recommended Action:</strong> Implement hybrid pricing: $29 base tier with ~20K token allowance, then graduated usage pricing beyond threshold. This preserves acquisition while automatically capturing value as customers scale—converting the loss center into a self-correcting revenue engine without disrupting the funnel.
-                            </div>
-                        </div>
-                        <div class="insight-visual">
-                            <canvas id="starterTierChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Insight 2: Portfolio Misallocation Crisis -->
-                <div class="insight-card">
-                    <div class="insight-header">
-                        <div class="insight-number">2</div>
-                        <h3>The Portfolio Misallocation Crisis: $400K+ in Accumulated Losses from "Power User" Subsidy</h3>
-                    </div>
-                    <div class="insight-content">
-                        <div class="insight-text">
-                            <div class="insight-finding">
-                                <strong>Key Metric:</strong> 459 heavy users (92% of base) at -185% margins vs. 1 light user at 72% margin. 426 unprofitable customers losing $68K monthly ($819K annually).
-                            </div>
-                            <div class="insight-detail">
-                                <strong>Business Impact:</strong> Customer acquisition strategy systematically attracts unprofitable profiles. Marketing positions "unlimited AI for $99/month" when unit economics require &lt;5K tokens/month usage. Current funnel selects against profitable customers.
-                            </div>
-                            <div class="insight-action">
-                                <strong>Recommended Action:</strong> Reverse-engineer the 23 high-margin customers (&gt;50% margins)—teams using AI for bounded workflows vs. replacing job functions. Rebuild acquisition to attract 100 customers matching this profile. Prioritize margin quality over volume scale.
-                            </div>
-                        </div>
-                        <div class="insight-visual">
-                            <canvas id="portfolioChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-
-                <!-- Insight 3: Free-Tier-to-Paid Conversion Illusion -->
-                <div class="insight-card">
-                    <div class="insight-header">
-                        <div class="insight-number">3</div>
-                        <h3>The Free-Tier-to-Paid Conversion Illusion: 95% Retention on Free = 95% Revenue Leakage</h3>
-                    </div>
-                    <div class="insight-content">
-                        <div class="insight-text">
-                            <div class="insight-finding">
-                                <strong>Key Metric:</strong> 50K free users at $2/user cost = $100K/month in unrecovered expenses. 95% retention on free tier with &lt;5% conversion to paid. "Advanced AI Analytics" costs $30K/month with 3% adoption ($560K annual waste).
-                            </div>
-                            <div class="insight-detail">
-                                <strong>Business Impact:</strong> Free tier is too generous—users love the product at $0 but won't upgrade. Paid tiers bloated with 12 underutilized features justify discounting. Creates vicious cycle: generous free tier → low conversion → add unused features → worse margins → more discounting.
-                            </div>
-                            <div class="insight-action">
-                                <strong>Recommended Action:</strong> Redesign free tier to create intentional friction (60 min/month at $0.30/user, targeting 8% conversion). Sunset 12 underutilized features. Rebuild paid tiers around the 3 high-adoption features (61% of costs, ~100% usage). Clear value prop: pay to remove limits on features you already use.
-                            </div>
-                        </div>
-                        <div class="insight-visual">
-                            <canvas id="freeTierChart"></canvas>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            {report_cards_html}
-
-            <div class="footer">
-                <p>This is a static showcase deployment hosted on GitHub Pages</p>
-                <p>For the live local version with data generation and real-time analysis, see the <a href="https://github.com/revenium/finops-showcase" class="github-link">GitHub repository</a></p>
-            </div>
-        </div>
-    </div>
-    <script>
-        // Initialize Executive Summary Charts
-        function initExecutiveSummaryCharts() {{
-            // Chart 1: Starter Tier Paradox - Margin vs Expansion Potential
-            const starterTierCtx = document.getElementById('starterTierChart');
-            if (starterTierCtx) {{
-                new Chart(starterTierCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Current Margin', 'AI Cost per Customer', 'Expansion Potential'],
-                        datasets: [{{
-                            label: 'Starter Tier Economics',
-                            data: [-264.6, 106, 51100/482],
-                            backgroundColor: [
-                                'rgba(244, 67, 54, 0.7)',
-                                'rgba(255, 152, 0, 0.7)',
-                                'rgba(76, 175, 80, 0.7)'
-                            ],
-                            borderColor: [
-                                'rgba(244, 67, 54, 1)',
-                                'rgba(255, 152, 0, 1)',
-                                'rgba(76, 175, 80, 1)'
-                            ],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: true,
-                        plugins: {{
-                            legend: {{
-                                display: false
-                            }},
-                            title: {{
-                                display: true,
-                                text: 'Starter Tier: Loss vs Expansion Value',
-                                font: {{
-                                    size: 16,
-                                    weight: 'bold'
-                                }}
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        let label = context.dataset.label || '';
-                                        if (label) {{
-                                            label += ': ';
-                                        }}
-                                        if (context.dataIndex === 0) {{
-                                            label += context.parsed.y + '% margin';
-                                        }} else if (context.dataIndex === 1) {{
-                                            label += '$' + context.parsed.y + ' per customer';
-                                        }} else {{
-                                            label += '$' + context.parsed.y.toFixed(0) + ' per customer';
-                                        }}
-                                        return label;
-                                    }}
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                title: {{
-                                    display: true,
-                                    text: 'Value ($)'
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-
-            // Chart 2: Portfolio Misallocation - Customer Distribution
-            const portfolioCtx = document.getElementById('portfolioChart');
-            if (portfolioCtx) {{
-                new Chart(portfolioCtx, {{
-                    type: 'doughnut',
-                    data: {{
-                        labels: [
-                            'Heavy Users (-185% margin)',
-                            'Unprofitable Customers',
-                            'High-Margin Customers',
-                            'Light Users (72% margin)'
-                        ],
-                        datasets: [{{
-                            data: [459, 426, 23, 1],
-                            backgroundColor: [
-                                'rgba(244, 67, 54, 0.7)',
-                                'rgba(255, 152, 0, 0.7)',
-                                'rgba(76, 175, 80, 0.7)',
-                                'rgba(33, 150, 243, 0.7)'
-                            ],
-                            borderColor: [
-                                'rgba(244, 67, 54, 1)',
-                                'rgba(255, 152, 0, 1)',
-                                'rgba(76, 175, 80, 1)',
-                                'rgba(33, 150, 243, 1)'
-                            ],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: true,
-                        plugins: {{
-                            legend: {{
-                                position: 'bottom',
-                                labels: {{
-                                    padding: 15,
-                                    font: {{
-                                        size: 11
-                                    }}
-                                }}
-                            }},
-                            title: {{
-                                display: true,
-                                text: 'Customer Profitability Distribution',
-                                font: {{
-                                    size: 16,
-                                    weight: 'bold'
-                                }}
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        let label = context.label || '';
-                                        let value = context.parsed;
-                                        let total = context.dataset.data.reduce((a, b) => a + b, 0);
-                                        let percentage = ((value / total) * 100).toFixed(1);
-                                        return label + ': ' + value + ' customers (' + percentage + '%)';
-                                    }}
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-
-            // Chart 3: Free Tier Conversion - Retention vs Revenue
-            const freeTierCtx = document.getElementById('freeTierChart');
-            if (freeTierCtx) {{
-                new Chart(freeTierCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: ['Free Tier Retention', 'Conversion to Paid', 'Feature Waste', 'Cost Recovery'],
-                        datasets: [{{
-                            label: 'Percentage',
-                            data: [95, 5, 75, 5],
-                            backgroundColor: [
-                                'rgba(244, 67, 54, 0.7)',
-                                'rgba(255, 152, 0, 0.7)',
-                                'rgba(156, 39, 176, 0.7)',
-                                'rgba(76, 175, 80, 0.7)'
-                            ],
-                            borderColor: [
-                                'rgba(244, 67, 54, 1)',
-                                'rgba(255, 152, 0, 1)',
-                                'rgba(156, 39, 176, 1)',
-                                'rgba(76, 175, 80, 1)'
-                            ],
-                            borderWidth: 2
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: true,
-                        plugins: {{
-                            legend: {{
-                                display: false
-                            }},
-                            title: {{
-                                display: true,
-                                text: 'Free Tier Economics',
-                                font: {{
-                                    size: 16,
-                                    weight: 'bold'
-                                }}
-                            }},
-                            tooltip: {{
-                                callbacks: {{
-                                    label: function(context) {{
-                                        return context.label + ': ' + context.parsed.y + '%';
-                                    }}
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                max: 100,
-                                title: {{
-                                    display: true,
-                                    text: 'Percentage (%)'
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-        }}
-
-        // Initialize charts when DOM is ready
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', initExecutiveSummaryCharts);
-        }} else {{
-            initExecutiveSummaryCharts();
-        }}
-    </script>
-</body>
-</html>
-"""
-
-        with open(output_path, 'w') as f:
-            f.write(html)
+                report_cards.append(self.REPORT_CARD_HTML.format(
+                    title=report['title'],
+                    description=report.get('description', f'{report["size_kb"]:.1f} KB'),
+                    filename=report['filename']
+                ))
+            report_cards.append('</div>\n\n')
+
+        with open(STATIC_INDEX_TEMPLATE, encoding='utf-8') as f:
+            html = f.read()
+        # Report cards last, so text inside them is never taken for a placeholder
+        for placeholder, value in (
+            ('__GENERATION_TIME__', generation_time),
+            ('__DATA_SIZE_MB__', data_size_mb),
+            ('__TOTAL_CALLS__', total_calls),
+            ('__REPORT_COUNT__', len(available_reports)),
+            ('__REPORT_CARDS__', ''.join(report_cards)),
+        ):
+            html = html.replace(placeholder, str(value))
+        return html
 
     def create_status_page(self, output_path: str, static_mode: bool = False):
         """Create the main status/index page.
@@ -1542,906 +1936,13 @@ class StatusViewerServer:
         if static_mode:
             return self.create_static_index(output_path)
 
-        # Otherwise, generate the full dynamic page for local server
-        html = """<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <title>Revenium FinOps Showcase - Status Viewer</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container {
-            max-width: 1400px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            overflow: hidden;
-        }
-        .header {
-            background: linear-gradient(135deg, #1a1a1a 0%, #2d2d2d 100%);
-            color: white;
-            padding: 40px;
-            text-align: center;
-        }
-        .header h1 {
-            font-size: 36px;
-            margin-bottom: 10px;
-        }
-        .header p {
-            font-size: 16px;
-            opacity: 0.8;
-        }
-        .content {
-            padding: 40px;
-        }
-        .section {
-            margin-bottom: 40px;
-        }
-        .section h2 {
-            color: #1a1a1a;
-            margin-bottom: 20px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }
-        .progress-container {
-            background: #f5f5f5;
-            padding: 30px;
-            border-radius: 8px;
-            margin-bottom: 20px;
-        }
-        .progress-bar-container {
-            background: #e0e0e0;
-            height: 40px;
-            border-radius: 20px;
-            overflow: hidden;
-            position: relative;
-            margin: 20px 0;
-        }
-        .progress-bar {
-            background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-            height: 100%;
-            transition: width 0.3s ease;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: white;
-            font-weight: 600;
-        }
-        .progress-stats {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin-top: 20px;
-        }
-        .stat {
-            background: white;
-            padding: 15px;
-            border-radius: 6px;
-            border-left: 4px solid #667eea;
-        }
-        .stat-label {
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        .stat-value {
-            font-size: 24px;
-            font-weight: bold;
-            color: #1a1a1a;
-            margin-top: 5px;
-        }
-        .report-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-        }
-        .report-card {
-            background: white;
-            border: 2px solid #e0e0e0;
-            border-radius: 8px;
-            padding: 20px;
-            transition: all 0.2s;
-            position: relative;
-        }
-        .report-card:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-        }
-        .report-card.available {
-            border-color: #4CAF50;
-            background: #f1f8f4;
-        }
-        .report-card.unavailable {
-            border-color: #ff9800;
-            background: #fff8f0;
-            opacity: 0.7;
-        }
-        .status-badge {
-            position: absolute;
-            top: 15px;
-            right: 15px;
-            padding: 5px 12px;
-            border-radius: 12px;
-            font-size: 11px;
-            font-weight: 600;
-            color: white;
-        }
-        .status-badge.complete {
-            background: #4CAF50;
-        }
-        .status-badge.pending {
-            background: #ff9800;
-        }
-        .status-badge.reprocessing {
-            background: #2196f3;
-            animation: pulse 1.5s ease-in-out infinite;
-        }
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.6; }
-        }
-        .report-card h3 {
-            margin-bottom: 10px;
-            color: #1a1a1a;
-            padding-right: 80px;
-        }
-        .report-card p {
-            color: #666;
-            font-size: 14px;
-            margin-bottom: 15px;
-        }
-        .button-group {
-            display: flex;
-            gap: 10px;
-            margin-top: 15px;
-        }
-        .run-button, .view-button {
-            display: inline-block;
-            color: white;
-            padding: 10px 20px;
-            text-decoration: none;
-            border-radius: 4px;
-            transition: background 0.2s;
-            border: none;
-            cursor: pointer;
-            font-size: 14px;
-            font-family: inherit;
-        }
-        .run-button {
-            background: #9C27B0;
-            flex: 0 0 auto;
-        }
-        .run-button:hover {
-            background: #7B1FA2;
-        }
-        .run-button:disabled {
-            background: #ccc;
-            cursor: not-allowed;
-        }
-        .view-button {
-            background: #2196f3;
-            flex: 1;
-        }
-        .view-button:hover {
-            background: #1976d2;
-        }
-        .view-button.disabled {
-            background: #ccc;
-            pointer-events: none;
-        }
-        .auto-refresh {
-            text-align: center;
-            padding: 20px;
-            background: #f5f5f5;
-            border-radius: 8px;
-            margin-top: 20px;
-            color: #666;
-        }
-        .workflow {
-            background: #e3f2fd;
-            padding: 20px;
-            border-radius: 8px;
-            border-left: 4px solid #2196f3;
-            margin-bottom: 30px;
-        }
-        .workflow h3 {
-            color: #1976d2;
-            margin-bottom: 10px;
-        }
-        .workflow ol {
-            margin-left: 20px;
-            line-height: 1.8;
-        }
-        /* Admin Panel - macOS Light Mode Style */
-        .admin-panel {
-            background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
-            border-radius: 12px;
-            padding: 30px;
-            box-shadow: 0 4px 16px rgba(0,0,0,0.1);
-            border: 1px solid #e0e0e0;
-        }
-        .admin-section {
-            margin-bottom: 30px;
-        }
-        .admin-section:last-child {
-            margin-bottom: 0;
-        }
-        .admin-section h3 {
-            color: #1a1a1a;
-            font-size: 16px;
-            font-weight: 600;
-            margin-bottom: 15px;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }
-        .admin-controls {
-            display: flex;
-            gap: 15px;
-            flex-wrap: wrap;
-        }
-        .control-group {
-            flex: 1;
-            min-width: 300px;
-        }
-        .control-group label {
-            display: block;
-            color: #666;
-            font-size: 12px;
-            margin-bottom: 8px;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        .input-group {
-            display: flex;
-            gap: 10px;
-        }
-        .input-group input[type="text"] {
-            flex: 1;
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            color: #1a1a1a;
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-            font-family: inherit;
-            transition: all 0.2s;
-        }
-        .input-group input[type="text"]:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-        .input-group input[type="text"]::placeholder {
-            color: #999;
-        }
-        .csv-select {
-            flex: 1;
-            background: #ffffff;
-            border: 1px solid #d0d0d0;
-            color: #1a1a1a;
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-            font-family: inherit;
-            transition: all 0.2s;
-            cursor: pointer;
-        }
-        .csv-select:focus {
-            outline: none;
-            border-color: #667eea;
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }
-        .csv-select option {
-            background: #ffffff;
-            color: #1a1a1a;
-            padding: 8px;
-        }
-        .csv-info {
-            margin-top: 8px;
-            font-size: 12px;
-            color: #666;
-            font-family: 'SF Mono', Monaco, 'Courier New', monospace;
-        }
-        .csv-info.current {
-            color: #28a745;
-            font-weight: 600;
-        }
-        .btn-secondary {
-            background: #f0f0f0;
-            border: 1px solid #d0d0d0;
-            color: #1a1a1a;
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        .btn-secondary:hover {
-            background: #e8e8e8;
-            border-color: #667eea;
-        }
-        .btn-secondary:active {
-            transform: scale(0.95);
-        }
-        .btn-primary {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            padding: 12px 24px;
-            border-radius: 8px;
-            font-size: 14px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }
-        .btn-primary:hover {
-            transform: translateY(-1px);
-            box-shadow: 0 6px 16px rgba(102, 126, 234, 0.4);
-        }
-        .btn-primary:active {
-            transform: translateY(0);
-        }
-        .btn-primary:disabled {
-            background: #444;
-            cursor: not-allowed;
-            box-shadow: none;
-            transform: none;
-        }
-        .btn-action {
-            flex: 1;
-            min-width: 200px;
-            background: #ffffff;
-            border: 2px solid #d0d0d0;
-            color: #1a1a1a;
-            padding: 16px 24px;
-            border-radius: 10px;
-            font-size: 15px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 10px;
-        }
-        .btn-action:hover {
-            background: #f8f9fa;
-            border-color: #667eea;
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.15);
-        }
-        .btn-action:active {
-            transform: translateY(0);
-        }
-        .btn-action:disabled {
-            opacity: 0.5;
-            cursor: not-allowed;
-            transform: none;
-        }
-        .btn-icon {
-            font-size: 14px;
-        }
-        .status-message {
-            margin-top: 12px;
-            padding: 12px 16px;
-            border-radius: 8px;
-            font-size: 13px;
-            display: none;
-        }
-        .status-message.success {
-            background: rgba(40, 167, 69, 0.1);
-            color: #28a745;
-            border: 1px solid rgba(40, 167, 69, 0.3);
-            display: block;
-        }
-        .status-message.error {
-            background: rgba(220, 53, 69, 0.1);
-            color: #dc3545;
-            border: 1px solid rgba(220, 53, 69, 0.3);
-            display: block;
-        }
-        .status-message.info {
-            background: rgba(0, 123, 255, 0.1);
-            color: #007bff;
-            border: 1px solid rgba(0, 123, 255, 0.3);
-            display: block;
-        }
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        .stat-card {
-            background: #ffffff;
-            padding: 16px;
-            border-radius: 10px;
-            border: 1px solid #e0e0e0;
-        }
-        .stat-card .stat-label {
-            font-size: 11px;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }
-        .stat-card .stat-value {
-            font-size: 22px;
-            font-weight: bold;
-            color: #1a1a1a;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Revenium FinOps Showcase</h1>
-            <p>AI Cost Management & Usage-Based Revenue Analysis</p>
-        </div>
-
-        <div class="content">
-            <div class="workflow">
-                <h3>Workflow</h3>
-                <ol>
-                    <li><strong>Run simulator:</strong> <code>cd ../src && python3 run_all_simulators.py</code></li>
-                    <li><strong>Run analyzers:</strong> <code>cd ../src && python3 run_all_analyzers.py</code></li>
-                    <li><strong>View reports:</strong> Refresh browser to see updated status</li>
-                </ol>
-            </div>
-
-            <div class="section">
-                <h2>Admin Panel</h2>
-                <div class="admin-panel">
-                    <div class="admin-section">
-                        <h3>Data Management</h3>
-                        <div class="admin-controls">
-                            <div class="control-group">
-                                <label>Load CSV File</label>
-                                <div class="input-group">
-                                    <select id="csv-selector" class="csv-select">
-                                        <option value="">Loading CSV files...</option>
-                                    </select>
-                                    <button onclick="refreshCSVList()" class="btn-secondary" title="Refresh CSV list">⟳</button>
-                                    <button onclick="loadSelectedCSV()" class="btn-primary">Load CSV</button>
-                                </div>
-                                <div id="csv-info" class="csv-info"></div>
-                                <div id="csv-loader-message" class="status-message"></div>
-                            </div>
-                        </div>
-                    </div>
-
-                    <div class="admin-section">
-                        <h3>Pipeline Actions</h3>
-                        <div class="admin-controls">
-                            <button onclick="runSimulators()" id="run-simulators-btn" class="btn-action">
-                                <span class="btn-icon">▶</span>
-                                <span class="btn-label">Run Simulators</span>
-                            </button>
-                            <button onclick="runAllAnalyzers()" id="run-all-analyzers-btn" class="btn-action">
-                                <span class="btn-icon">▶</span>
-                                <span class="btn-label">Run All Analyzers</span>
-                            </button>
-                        </div>
-                        <div id="pipeline-status" class="status-message"></div>
-                    </div>
-
-                    <div class="admin-section">
-                        <h3>CSV Statistics</h3>
-                        <div class="stats-grid">
-                            <div class="stat-card">
-                                <div class="stat-label">CSV Size</div>
-                                <div class="stat-value" id="csv-size">-</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">Target Size</div>
-                                <div class="stat-value" id="csv-target">2048 MB</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">Progress</div>
-                                <div class="stat-value" id="csv-progress">0%</div>
-                            </div>
-                            <div class="stat-card">
-                                <div class="stat-label">Total Calls</div>
-                                <div class="stat-value" id="csv-lines">-</div>
-                            </div>
-                        </div>
-                        <div class="progress-bar-container">
-                            <div class="progress-bar" id="progress-bar" style="width: 0%">
-                                <span id="progress-text">0%</span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-            <div class="section">
-                <h2>Analysis Reports</h2>
-                <div class="report-grid" id="report-grid">
-                    <!-- Reports will be populated by JavaScript -->
-                </div>
-            </div>
-
-            <div class="auto-refresh">
-                Last updated: <span id="last-update">-</span> |
-                Auto-refresh every 1 second
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // Map filenames to analyzer IDs
-        const ANALYZER_IDS = {
-            'understanding.html': 'understanding',
-            'performance.html': 'performance',
-            'realtime.html': 'realtime',
-            'optimization.html': 'optimization',
-            'alignment.html': 'alignment',
-            'profitability.html': 'profitability',
-            'pricing.html': 'pricing',
-            'features.html': 'features'
-        };
-
-        function formatSize(mb) {
-            if (mb < 1) {
-                return (mb * 1024).toFixed(1) + ' KB';
-            } else if (mb >= 1024) {
-                return (mb / 1024).toFixed(2) + ' GB';
-            }
-            return mb.toFixed(2) + ' MB';
-        }
-
-        function formatNumber(num) {
-            return num.toLocaleString();
-        }
-
-        function populateCSVList() {
-            const selector = document.getElementById('csv-selector');
-            const infoDiv = document.getElementById('csv-info');
-
-            fetch('/api/list_csv_files?_=' + Date.now())
-                .then(r => r.json())
-                .then(data => {
-                    if (data.success && data.files.length > 0) {
-                        // Clear existing options
-                        selector.innerHTML = '';
-
-                        // Add CSV files as options
-                        data.files.forEach(file => {
-                            const option = document.createElement('option');
-                            option.value = file.filename;
-                            option.textContent = `${file.filename} (${file.size_mb} MB)`;
-                            if (file.is_current) {
-                                option.selected = true;
-                            }
-                            selector.appendChild(option);
-                        });
-
-                        // Update info with selected file details
-                        updateCSVInfo();
-                    } else if (data.success && data.files.length === 0) {
-                        selector.innerHTML = '<option value="">No CSV files found</option>';
-                        infoDiv.textContent = '';
-                    } else {
-                        selector.innerHTML = '<option value="">Error loading CSV files</option>';
-                        infoDiv.textContent = data.error || 'Unknown error';
-                        infoDiv.className = 'csv-info';
-                    }
-                })
-                .catch(e => {
-                    console.error('Error listing CSV files:', e);
-                    selector.innerHTML = '<option value="">Failed to load CSV files</option>';
-                    infoDiv.textContent = e.message;
-                    infoDiv.className = 'csv-info';
-                });
-        }
-
-        function updateCSVInfo() {
-            const selector = document.getElementById('csv-selector');
-            const infoDiv = document.getElementById('csv-info');
-            const selectedFilename = selector.value;
-
-            if (!selectedFilename) {
-                infoDiv.textContent = '';
-                return;
-            }
-
-            // Fetch file details
-            fetch('/api/list_csv_files?_=' + Date.now())
-                .then(r => r.json())
-                .then(data => {
-                    if (data.success) {
-                        const file = data.files.find(f => f.filename === selectedFilename);
-                        if (file) {
-                            infoDiv.textContent = `Modified: ${file.modified_display} | Size: ${file.size_mb} MB`;
-                            infoDiv.className = file.is_current ? 'csv-info current' : 'csv-info';
-                        }
-                    }
-                })
-                .catch(e => {
-                    console.error('Error getting CSV info:', e);
-                });
-        }
-
-        function refreshCSVList() {
-            populateCSVList();
-        }
-
-        function loadSelectedCSV() {
-            const selector = document.getElementById('csv-selector');
-            const messageDiv = document.getElementById('csv-loader-message');
-            const csvFilename = selector.value;
-
-            if (!csvFilename) {
-                messageDiv.className = 'status-message error';
-                messageDiv.textContent = 'Please select a CSV file';
-                return;
-            }
-
-            // Reset message
-            messageDiv.className = 'status-message info';
-            messageDiv.textContent = 'Loading...';
-
-            // Send POST request to load CSV
-            fetch('/api/load_csv?csv_filename=' + encodeURIComponent(csvFilename), {
-                method: 'POST'
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    messageDiv.className = 'status-message success';
-                    messageDiv.textContent = data.message;
-                    // Refresh CSV list to update current file indicator
-                    populateCSVList();
-                    // Trigger immediate status update
-                    updateStatus();
-                } else {
-                    messageDiv.className = 'status-message error';
-                    messageDiv.textContent = 'Error: ' + data.error;
-                }
-            })
-            .catch(e => {
-                console.error('Error loading CSV:', e);
-                messageDiv.className = 'status-message error';
-                messageDiv.textContent = 'Failed to load CSV: ' + e.message;
-            });
-        }
-
-        function runSimulators() {
-            const button = document.getElementById('run-simulators-btn');
-            const messageDiv = document.getElementById('pipeline-status');
-
-            button.disabled = true;
-            button.querySelector('.btn-label').textContent = 'Running...';
-            messageDiv.className = 'status-message info';
-            messageDiv.textContent = 'Starting simulators...';
-
-            fetch('/api/run_simulators', {
-                method: 'POST'
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    messageDiv.className = 'status-message success';
-                    messageDiv.textContent = data.message;
-                    // Re-enable after a delay
-                    setTimeout(() => {
-                        button.disabled = false;
-                        button.querySelector('.btn-label').textContent = 'Run Simulators';
-                    }, 3000);
-                } else {
-                    messageDiv.className = 'status-message error';
-                    messageDiv.textContent = 'Error: ' + data.error;
-                    button.disabled = false;
-                    button.querySelector('.btn-label').textContent = 'Run Simulators';
-                }
-            })
-            .catch(e => {
-                console.error('Error running simulators:', e);
-                messageDiv.className = 'status-message error';
-                messageDiv.textContent = 'Failed to start simulators: ' + e.message;
-                button.disabled = false;
-                button.querySelector('.btn-label').textContent = 'Run Simulators';
-            });
-        }
-
-        function runAllAnalyzers() {
-            const button = document.getElementById('run-all-analyzers-btn');
-            const messageDiv = document.getElementById('pipeline-status');
-
-            button.disabled = true;
-            button.querySelector('.btn-label').textContent = 'Running...';
-            messageDiv.className = 'status-message info';
-            messageDiv.textContent = 'Starting all analyzers...';
-
-            fetch('/api/run_all_analyzers', {
-                method: 'POST'
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    messageDiv.className = 'status-message success';
-                    messageDiv.textContent = data.message;
-                    // Re-enable after a delay
-                    setTimeout(() => {
-                        button.disabled = false;
-                        button.querySelector('.btn-label').textContent = 'Run All Analyzers';
-                    }, 3000);
-                } else {
-                    messageDiv.className = 'status-message error';
-                    messageDiv.textContent = 'Error: ' + data.error;
-                    button.disabled = false;
-                    button.querySelector('.btn-label').textContent = 'Run All Analyzers';
-                }
-            })
-            .catch(e => {
-                console.error('Error running analyzers:', e);
-                messageDiv.className = 'status-message error';
-                messageDiv.textContent = 'Failed to start analyzers: ' + e.message;
-                button.disabled = false;
-                button.querySelector('.btn-label').textContent = 'Run All Analyzers';
-            });
-        }
-
-        function runAnalyzer(analyzerId, button) {
-            // Disable the button
-            button.disabled = true;
-            button.textContent = 'Running...';
-
-            // Send POST request to run analyzer
-            fetch('/api/run_analyzer?analyzer_id=' + analyzerId, {
-                method: 'POST'
-            })
-            .then(r => r.json())
-            .then(data => {
-                if (data.success) {
-                    console.log('Analyzer started:', analyzerId);
-                } else {
-                    alert('Failed to start analyzer: ' + data.error);
-                    button.disabled = false;
-                    button.textContent = '⟳ Run';
-                }
-            })
-            .catch(e => {
-                console.error('Error starting analyzer:', e);
-                alert('Failed to start analyzer');
-                button.disabled = false;
-                button.textContent = '⟳ Run';
-            });
-        }
-
-        function updateStatus() {
-            fetch('/api/status?_=' + Date.now())
-                .then(r => r.json())
-                .then(data => {
-                    // Update CSV progress
-                    const csv = data.csv;
-                    document.getElementById('csv-size').textContent = formatSize(csv.size_mb);
-                    document.getElementById('csv-progress').textContent = csv.progress_pct.toFixed(1) + '%';
-                    document.getElementById('csv-lines').textContent = formatNumber(csv.line_count);
-
-                    const progressBar = document.getElementById('progress-bar');
-                    progressBar.style.width = csv.progress_pct + '%';
-                    document.getElementById('progress-text').textContent = csv.progress_pct.toFixed(1) + '%';
-
-                    // Update pipeline status based on simulator/analyzer progress
-                    const pipelineMessage = document.getElementById('pipeline-status');
-                    const simulatorBtn = document.getElementById('run-simulators-btn');
-                    const analyzerBtn = document.getElementById('run-all-analyzers-btn');
-
-                    // Handle simulator status
-                    if (data.simulator_status && data.simulator_status.status === 'running') {
-                        pipelineMessage.className = 'status-message info';
-                        pipelineMessage.textContent = data.simulator_status.message;
-                        simulatorBtn.disabled = true;
-                        simulatorBtn.querySelector('.btn-label').textContent = 'Running...';
-                    } else if (data.simulator_status && data.simulator_status.status === 'complete') {
-                        pipelineMessage.className = 'status-message success';
-                        pipelineMessage.textContent = data.simulator_status.message;
-                        simulatorBtn.disabled = false;
-                        simulatorBtn.querySelector('.btn-label').textContent = 'Run Simulators';
-                    } else if (data.simulator_status && data.simulator_status.status === 'error') {
-                        pipelineMessage.className = 'status-message error';
-                        pipelineMessage.textContent = data.simulator_status.message;
-                        simulatorBtn.disabled = false;
-                        simulatorBtn.querySelector('.btn-label').textContent = 'Run Simulators';
-                    }
-
-                    // Handle all analyzers status
-                    if (data.all_analyzers_status && data.all_analyzers_status.status === 'running') {
-                        pipelineMessage.className = 'status-message info';
-                        const progress = `${data.all_analyzers_status.completed}/${data.all_analyzers_status.total}`;
-                        const current = data.all_analyzers_status.current ? ` - ${data.all_analyzers_status.current}` : '';
-                        pipelineMessage.textContent = `Running analyzers (${progress})${current}`;
-                        analyzerBtn.disabled = true;
-                        analyzerBtn.querySelector('.btn-label').textContent = 'Running...';
-                    } else if (data.all_analyzers_status && data.all_analyzers_status.status === 'complete') {
-                        pipelineMessage.className = 'status-message success';
-                        pipelineMessage.textContent = data.all_analyzers_status.message;
-                        analyzerBtn.disabled = false;
-                        analyzerBtn.querySelector('.btn-label').textContent = 'Run All Analyzers';
-                    } else if (data.all_analyzers_status && data.all_analyzers_status.status === 'error') {
-                        pipelineMessage.className = 'status-message error';
-                        pipelineMessage.textContent = data.all_analyzers_status.message;
-                        analyzerBtn.disabled = false;
-                        analyzerBtn.querySelector('.btn-label').textContent = 'Run All Analyzers';
-                    }
-
-                    // Update report grid
-                    const reportGrid = document.getElementById('report-grid');
-                    reportGrid.innerHTML = '';
-
-                    const analyzerStatus = data.analyzer_status || {};
-
-                    for (const [filename, info] of Object.entries(data.reports)) {
-                        const analyzerId = ANALYZER_IDS[filename];
-                        const status = analyzerStatus[analyzerId];
-                        const isReprocessing = status && status.status === 'reprocessing';
-
-                        const card = document.createElement('div');
-                        card.className = 'report-card ' + (info.exists ? 'available' : 'unavailable');
-
-                        let statusBadge;
-                        if (isReprocessing) {
-                            statusBadge = '<div class="status-badge reprocessing">⟳ Reprocessing</div>';
-                        } else if (info.exists) {
-                            statusBadge = '<div class="status-badge complete">✓ Complete</div>';
-                        } else {
-                            statusBadge = '<div class="status-badge pending">⋯ Pending</div>';
-                        }
-
-                        const viewButton = info.exists ?
-                            `<a href="${filename}" class="view-button">View Report →</a>` :
-                            '<span class="view-button disabled">Not Generated</span>';
-
-                        const runButton = `<button class="run-button" onclick="runAnalyzer('${analyzerId}', this)" ${isReprocessing ? 'disabled' : ''}>⟳ Run</button>`;
-
-                        card.innerHTML = `
-                            ${statusBadge}
-                            <h3>${info.name}</h3>
-                            <p>${info.exists ? 'Report available (' + info.size_kb.toFixed(1) + ' KB)' : 'Run analyzers to generate'}</p>
-                            <div class="button-group">
-                                ${runButton}
-                                ${viewButton}
-                            </div>
-                        `;
-
-                        reportGrid.appendChild(card);
-                    }
-
-                    // Update timestamp
-                    document.getElementById('last-update').textContent =
-                        new Date(data.timestamp).toLocaleTimeString();
-                })
-                .catch(e => {
-                    console.log('Status update failed:', e);
-                });
-        }
-
-        // Add change listener to CSV selector
-        document.getElementById('csv-selector').addEventListener('change', updateCSVInfo);
-
-        // Initialize CSV dropdown
-        populateCSVList();
-
-        // Update immediately and then every 1 second
-        updateStatus();
-        setInterval(updateStatus, 1000);
-    </script>
-</body>
-</html>"""
-
-        with open(output_path, 'w') as f:
-            f.write(html)
+        # Otherwise, write the dynamic page template (viewer/templates/index.html),
+        # versioning its asset URLs so browsers refetch them after an update
+        asset_version = max(os.stat(os.path.join(STATIC_DIR, name)).st_mtime_ns
+                            for name in STATIC_ASSETS)
+        with open(STATUS_PAGE_TEMPLATE, encoding='utf-8') as f:
+            html = f.read().replace('__ASSET_VERSION__', format(asset_version, 'x'))
+        write_text_atomic(output_path, html)
 
 
 def main():
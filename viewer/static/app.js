@@ -0,0 +1,460 @@
+// Map filenames to analyzer IDs
+const ANALYZER_IDS = {
+    'understanding.html': 'understanding',
+    'performance.html': 'performance',
+    'realtime.html': 'realtime',
+    'optimization.html': 'optimization',
+    'alignment.html': 'alignment',
+    'profitability.html': 'profitability',
+    'pricing.html': 'pricing',
+    'features.html': 'features'
+};
+
+function formatSize(mb) {
+    if (mb < 1) {
+        return (mb * 1024).toFixed(1) + ' KB';
+    } else if (mb >= 1024) {
+        return (mb / 1024).toFixed(2) + ' GB';
+    }
+    return mb.toFixed(2) + ' MB';
+}
+
+function formatNumber(num) {
+    return num.toLocaleString();
+}
+
+// Files from the last /api/list_csv_files response by filename, for updateCSVInfo
+let csvFiles = new Map();
+
+// ETag of that response; the server answers 304 while the list is unchanged
+let csvListEtag = null;
+
+// Aborts the list request still in flight, so only the newest one fills the dropdown
+let csvFetchCtl = null;
+
+function populateCSVList() {
+    const selector = document.getElementById('csv-selector');
+    const infoDiv = document.getElementById('csv-info');
+    const headers = csvListEtag ? { 'If-None-Match': csvListEtag } : {};
+    let etag = null;
+
+    if (csvFetchCtl) {
+        csvFetchCtl.abort();
+    }
+    csvFetchCtl = new AbortController();
+
+    fetch('/api/list_csv_files', { headers, signal: csvFetchCtl.signal })
+        .then(r => {
+            if (r.status === 304) {
+                return null;
+            }
+            etag = r.headers.get('ETag');
+            return r.json();
+        })
+        .then(data => {
+            if (!data) {
+                // Same files as last time; the dropdown is already up to date
+                updateCSVInfo();
+                return;
+            }
+            // Only remembered once the list is applied, so an aborted
+            // request can't leave the dropdown stale behind a 304
+            csvListEtag = etag;
+            csvFiles = new Map(data.success ? data.files.map(f => [f.filename, f]) : []);
+            if (data.success && data.files.length > 0) {
+                // Clear existing options
+                selector.innerHTML = '';
+
+                // Add CSV files as options
+                data.files.forEach(file => {
+                    const option = document.createElement('option');
+                    option.value = file.filename;
+                    option.textContent = `${file.filename} (${file.size_mb} MB)`;
+                    if (file.is_current) {
+                        option.selected = true;
+                    }
+                    selector.appendChild(option);
+                });
+
+                // Update info with selected file details
+                updateCSVInfo();
+            } else if (data.success && data.files.length === 0) {
+                selector.innerHTML = '<option value="">No CSV files found</option>';
+                infoDiv.textContent = '';
+            } else {
+                selector.innerHTML = '<option value="">Error loading CSV files</option>';
+                infoDiv.textContent = data.error || 'Unknown error';
+                infoDiv.className = 'csv-info';
+            }
+        })
+        .catch(e => {
+            if (e.name === 'AbortError') {
+                return;  // Superseded by a newer request
+            }
+            console.error('Error listing CSV files:', e);
+            selector.innerHTML = '<option value="">Failed to load CSV files</option>';
+            infoDiv.textContent = e.message;
+            infoDiv.className = 'csv-info';
+        });
+}
+
+function updateCSVInfo() {
+    const selector = document.getElementById('csv-selector');
+    const infoDiv = document.getElementById('csv-info');
+    const selectedFilename = selector.value;
+
+    if (!selectedFilename) {
+        infoDiv.textContent = '';
+        return;
+    }
+
+    // File details come from the list populateCSVList last fetched
+    const file = csvFiles.get(selectedFilename);
+    if (file) {
+        infoDiv.textContent = `Modified: ${file.modified_display} | Size: ${file.size_mb} MB`;
+        infoDiv.className = file.is_current ? 'csv-info current' : 'csv-info';
+    }
+}
+
+function refreshCSVList() {
+    populateCSVList();
+}
+
+function loadSelectedCSV() {
+    const selector = document.getElementById('csv-selector');
+    const messageDiv = document.getElementById('csv-loader-message');
+    const csvFilename = selector.value;
+
+    if (!csvFilename) {
+        messageDiv.className = 'status-message error';
+        messageDiv.textContent = 'Please select a CSV file';
+        return;
+    }
+
+    // Reset message
+    messageDiv.className = 'status-message info';
+    messageDiv.textContent = 'Loading...';
+
+    // Send POST request to load CSV
+    fetch('/api/load_csv?csv_filename=' + encodeURIComponent(csvFilename), {
+        method: 'POST'
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            messageDiv.className = 'status-message success';
+            messageDiv.textContent = data.message;
+            // Refresh CSV list to update current file indicator
+            populateCSVList();
+            // Trigger immediate status update
+            updateStatus();
+        } else {
+            messageDiv.className = 'status-message error';
+            messageDiv.textContent = 'Error: ' + data.error;
+        }
+    })
+    .catch(e => {
+        console.error('Error loading CSV:', e);
+        messageDiv.className = 'status-message error';
+        messageDiv.textContent = 'Failed to load CSV: ' + e.message;
+    });
+}
+
+function runSimulators() {
+    const button = document.getElementById('run-simulators-btn');
+    const messageDiv = document.getElementById('pipeline-status');
+
+    button.disabled = true;
+    button.querySelector('.btn-label').textContent = 'Running...';
+    messageDiv.className = 'status-message info';
+    messageDiv.textContent = 'Starting simulators...';
+
+    fetch('/api/run_simulators', {
+        method: 'POST'
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            messageDiv.className = 'status-message success';
+            messageDiv.textContent = data.message;
+            // Re-enable after a delay
+            setTimeout(() => {
+                button.disabled = false;
+                button.querySelector('.btn-label').textContent = 'Run Simulators';
+            }, 3000);
+        } else {
+            messageDiv.className = 'status-message error';
+            messageDiv.textContent = 'Error: ' + data.error;
+            button.disabled = false;
+            button.querySelector('.btn-label').textContent = 'Run Simulators';
+        }
+    })
+    .catch(e => {
+        console.error('Error running simulators:', e);
+        messageDiv.className = 'status-message error';
+        messageDiv.textContent = 'Failed to start simulators: ' + e.message;
+        button.disabled = false;
+        button.querySelector('.btn-label').textContent = 'Run Simulators';
+    });
+}
+
+function runAllAnalyzers() {
+    const button = document.getElementById('run-all-analyzers-btn');
+    const messageDiv = document.getElementById('pipeline-status');
+
+    button.disabled = true;
+    button.querySelector('.btn-label').textContent = 'Running...';
+    messageDiv.className = 'status-message info';
+    messageDiv.textContent = 'Starting all analyzers...';
+
+    fetch('/api/run_all_analyzers', {
+        method: 'POST'
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            messageDiv.className = 'status-message success';
+            messageDiv.textContent = data.message;
+            // Re-enable after a delay
+            setTimeout(() => {
+                button.disabled = false;
+                button.querySelector('.btn-label').textContent = 'Run All Analyzers';
+            }, 3000);
+        } else {
+            messageDiv.className = 'status-message error';
+            messageDiv.textContent = 'Error: ' + data.error;
+            button.disabled = false;
+            button.querySelector('.btn-label').textContent = 'Run All Analyzers';
+        }
+    })
+    .catch(e => {
+        console.error('Error running analyzers:', e);
+        messageDiv.className = 'status-message error';
+        messageDiv.textContent = 'Failed to start analyzers: ' + e.message;
+        button.disabled = false;
+        button.querySelector('.btn-label').textContent = 'Run All Analyzers';
+    });
+}
+
+function runAnalyzer(analyzerId, button) {
+    // Disable the button
+    button.disabled = true;
+    button.textContent = 'Running...';
+
+    // Send POST request to run analyzer
+    fetch('/api/run_analyzer?analyzer_id=' + analyzerId, {
+        method: 'POST'
+    })
+    .then(r => r.json())
+    .then(data => {
+        if (data.success) {
+            console.log('Analyzer started:', analyzerId);
+        } else {
+            alert('Failed to start analyzer: ' + data.error);
+            button.disabled = false;
+            button.textContent = '⟳ Run';
+        }
+    })
+    .catch(e => {
+        console.error('Error starting analyzer:', e);
+        alert('Failed to start analyzer');
+        button.disabled = false;
+        button.textContent = '⟳ Run';
+    });
+}
+
+// Last rendered status (minus timestamp); unchanged polls skip all DOM work
+let lastStatusKey = '';
+
+// Last rendered report grid inputs; the grid is only rebuilt when they change
+let lastReportGridKey = '';
+
+// Status waiting for the next animation frame (see scheduleRender)
+let pendingStatus = null;
+
+// Elements renderStatus writes to, looked up once (this script runs after the markup)
+const statusEls = {
+    lastUpdate: document.getElementById('last-update'),
+    csvSize: document.getElementById('csv-size'),
+    csvProgress: document.getElementById('csv-progress'),
+    csvLines: document.getElementById('csv-lines'),
+    progressBar: document.getElementById('progress-bar'),
+    progressText: document.getElementById('progress-text'),
+    pipelineMessage: document.getElementById('pipeline-status'),
+    simulatorBtn: document.getElementById('run-simulators-btn'),
+    simulatorLabel: document.querySelector('#run-simulators-btn .btn-label'),
+    analyzerBtn: document.getElementById('run-all-analyzers-btn'),
+    analyzerLabel: document.querySelector('#run-all-analyzers-btn .btn-label'),
+    reportGrid: document.getElementById('report-grid')
+};
+
+// ETag of the last status response; the server answers 304 while it matches
+let statusEtag = null;
+
+function updateStatus() {
+    const headers = statusEtag ? { 'If-None-Match': statusEtag } : {};
+    return fetch('/api/status', { headers })
+        .then(r => {
+            if (r.status === 304) {
+                return null;
+            }
+            statusEtag = r.headers.get('ETag');
+            return r.json();
+        })
+        .then(data => {
+            if (!data) {
+                // Nothing changed since the last poll
+                statusEls.lastUpdate.textContent = new Date().toLocaleTimeString();
+                return;
+            }
+            scheduleRender(data);
+        })
+        .catch(e => {
+            console.log('Status update failed:', e);
+        });
+}
+
+// Render on the next animation frame, so all of a status update's DOM writes
+// share one layout and updates arriving within a frame render only the latest
+function scheduleRender(data) {
+    if (pendingStatus === null) {
+        requestAnimationFrame(() => {
+            const data = pendingStatus;
+            pendingStatus = null;
+            renderStatus(data);
+        });
+    }
+    pendingStatus = data;
+}
+
+function renderStatus(data) {
+    // Update timestamp
+    statusEls.lastUpdate.textContent = new Date(data.timestamp * 1000).toLocaleTimeString();
+
+    const { timestamp, ...rest } = data;
+    const statusKey = JSON.stringify(rest);
+    if (statusKey === lastStatusKey) {
+        return;
+    }
+    lastStatusKey = statusKey;
+
+    // Update CSV progress
+    const csv = data.csv;
+    statusEls.csvSize.textContent = formatSize(csv.size_mb);
+    statusEls.csvProgress.textContent = csv.progress_pct.toFixed(1) + '%';
+    statusEls.csvLines.textContent = formatNumber(csv.line_count);
+
+    statusEls.progressBar.style.width = csv.progress_pct + '%';
+    statusEls.progressText.textContent = csv.progress_pct.toFixed(1) + '%';
+
+    // Update pipeline status based on simulator/analyzer progress
+    const { pipelineMessage, simulatorBtn, simulatorLabel, analyzerBtn, analyzerLabel } = statusEls;
+
+    // Handle simulator status
+    if (data.simulator_status && data.simulator_status.status === 'running') {
+        pipelineMessage.className = 'status-message info';
+        pipelineMessage.textContent = data.simulator_status.message;
+        simulatorBtn.disabled = true;
+        simulatorLabel.textContent = 'Running...';
+    } else if (data.simulator_status && data.simulator_status.status === 'complete') {
+        pipelineMessage.className = 'status-message success';
+        pipelineMessage.textContent = data.simulator_status.message;
+        simulatorBtn.disabled = false;
+        simulatorLabel.textContent = 'Run Simulators';
+    } else if (data.simulator_status && data.simulator_status.status === 'error') {
+        pipelineMessage.className = 'status-message error';
+        pipelineMessage.textContent = data.simulator_status.message;
+        simulatorBtn.disabled = false;
+        simulatorLabel.textContent = 'Run Simulators';
+    }
+
+    // Handle all analyzers status
+    if (data.all_analyzers_status && data.all_analyzers_status.status === 'running') {
+        pipelineMessage.className = 'status-message info';
+        // No count until the script's first progress line gives the total
+        const { completed, total } = data.all_analyzers_status;
+        const progress = total ? ` (${completed}/${total})` : '';
+        const current = data.all_analyzers_status.current ? ` - ${data.all_analyzers_status.current}` : '';
+        pipelineMessage.textContent = `Running analyzers${progress}${current}`;
+        analyzerBtn.disabled = true;
+        analyzerLabel.textContent = 'Running...';
+    } else if (data.all_analyzers_status && data.all_analyzers_status.status === 'complete') {
+        pipelineMessage.className = 'status-message success';
+        pipelineMessage.textContent = data.all_analyzers_status.message;
+        analyzerBtn.disabled = false;
+        analyzerLabel.textContent = 'Run All Analyzers';
+    } else if (data.all_analyzers_status && data.all_analyzers_status.status === 'error') {
+        pipelineMessage.className = 'status-message error';
+        pipelineMessage.textContent = data.all_analyzers_status.message;
+        analyzerBtn.disabled = false;
+        analyzerLabel.textContent = 'Run All Analyzers';
+    }
+
+    // Update report grid (unchanged while only the CSV is growing)
+    const reportGridKey = JSON.stringify([data.reports, data.analyzer_status]);
+    if (reportGridKey === lastReportGridKey) {
+        return;
+    }
+    lastReportGridKey = reportGridKey;
+
+    const reportGrid = statusEls.reportGrid;
+    reportGrid.innerHTML = '';
+
+    const analyzerStatus = data.analyzer_status || {};
+
+    for (const [filename, info] of Object.entries(data.reports)) {
+        const analyzerId = ANALYZER_IDS[filename];
+        const status = analyzerStatus[analyzerId];
+        const isReprocessing = status && status.status === 'reprocessing';
+
+        const card = document.createElement('div');
+        card.className = 'report-card ' + (info.exists ? 'available' : 'unavailable');
+
+        let statusBadge;
+        if (isReprocessing) {
+            statusBadge = '<div class="status-badge reprocessing">⟳ Reprocessing</div>';
+        } else if (info.exists) {
+            statusBadge = '<div class="status-badge complete">✓ Complete</div>';
+        } else {
+            statusBadge = '<div class="status-badge pending">⋯ Pending</div>';
+        }
+
+        const viewButton = info.exists ?
+            `<a href="${filename}" class="view-button">View Report →</a>` :
+            '<span class="view-button disabled">Not Generated</span>';
+
+        const runButton = `<button class="run-button" onclick="runAnalyzer('${analyzerId}', this)" ${isReprocessing ? 'disabled' : ''}>⟳ Run</button>`;
+
+        card.innerHTML = `
+            ${statusBadge}
+            <h3>${info.name}</h3>
+            <p>${info.exists ? 'Report available (' + info.size_kb.toFixed(1) + ' KB)' : 'Run analyzers to generate'}</p>
+            <div class="button-group">
+                ${runButton}
+                ${viewButton}
+            </div>
+        `;
+
+        reportGrid.appendChild(card);
+    }
+}
+
+// Add change listener to CSV selector
+document.getElementById('csv-selector').addEventListener('change', updateCSVInfo);
+
+// Initialize CSV dropdown
+populateCSVList();
+
+// Let the server push status changes; fall back to polling
+if (window.EventSource) {
+    const events = new EventSource('/api/events');
+    events.onmessage = e => scheduleRender(JSON.parse(e.data));
+    events.addEventListener('heartbeat', e => {
+        statusEls.lastUpdate.textContent = new Date(JSON.parse(e.data) * 1000).toLocaleTimeString();
+    });
+} else {
+    // Next poll a second after the previous one settles, so a slow
+    // response never has another request queued up behind it
+    const pollStatus = () => updateStatus().then(() => setTimeout(pollStatus, 1000));
+    pollStatus();
+}